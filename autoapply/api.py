@@ -8,7 +8,7 @@ import json
 import uuid
 
 from contextlib import asynccontextmanager
-from datetime import date, datetime
+from datetime import date
 from fastapi import FastAPI, UploadFile, File, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse
@@ -19,14 +19,22 @@ from autoapply.application_handlers import (
     get_application_answers,
     tailor_for_url,
     apply_for_url,
+    placeholder_job,
     parse_resume,
     list_resume,
 )
 from typing import Optional
 
-from autoapply.env import ALLOWED_ORIGINS
+from autoapply.env import (
+    ALLOWED_ORIGINS,
+    APPLICATION_POOL_SIZE,
+    BATCH_CONCURRENCY,
+    BROWSER_POOL_PREWARM,
+)
 from autoapply.services.scrape_google_results import GoogleSearchAutomation
-from autoapply.services.db import Txc, _calc_years_of_experience
+from autoapply.services.llm.agent import close_http_client
+from autoapply.resapp_ops import close_static_http_client
+from autoapply.services.db import Txc, TxcRO, _calc_years_of_experience, close_pool
 from autoapply.models import (
     ApplicationAnswers,
     Contact,
@@ -44,6 +52,9 @@ from autoapply.models import (
 )
 from autoapply.sse import SSEManager
 from autoapply.browser_manager import BrowserManager
+from autoapply.browser_pool import browser_pool
+from autoapply.playwright_runtime import stop_playwright
+from autoapply.utils import today_str
 
 get_logger()
 logger = logging.getLogger(__name__)
@@ -148,10 +159,19 @@ def _verify_password(password: str, stored: str) -> bool:
 sse_manager = SSEManager()
 browser_manager = BrowserManager()
 
-# Max concurrent job applications running at the same time
-APPLICATION_POOL_SIZE = 3
 _apply_semaphore = asyncio.Semaphore(APPLICATION_POOL_SIZE)
 
+# The event loop only keeps weak references to tasks; hold fire-and-forget
+# ones here so a queued application can't be garbage collected mid-run.
+_background_tasks: set[asyncio.Task] = set()
+
+
+def _spawn(coro) -> asyncio.Task:
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -188,6 +208,10 @@ async def lifespan(app: FastAPI):
             tx.cursor.execute(
                 "CREATE INDEX IF NOT EXISTS idx_discovered_jobs_query ON discovered_jobs(search_query)"
             )
+            tx.cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_discovered_jobs_last_seen "
+                "ON discovered_jobs(last_seen_at DESC) INCLUDE (url, search_query)"
+            )
             tx.conn.commit()
         logger.info("DB migrations applied")
     except Exception as e:
@@ -201,10 +225,18 @@ async def lifespan(app: FastAPI):
         logger.error(f"Failed to initialize browser manager: {e}")
         raise
 
+    # Pay the background browser's cold start now rather than on the first job
+    prewarm_task = None
+    if BROWSER_POOL_PREWARM > 0:
+        prewarm_task = asyncio.create_task(browser_pool.prewarm(BROWSER_POOL_PREWARM))
+
     # Launch scheduled job discovery (runs immediately then every 6 hours)
-    asyncio.create_task(_run_job_search_scheduler())
+    _spawn(_run_job_search_scheduler())
 
     yield
+    if prewarm_task and not prewarm_task.done():
+        prewarm_task.cancel()
+
     logger.info("Shutting down browser manager...")
     try:
         await browser_manager.shutdown()
@@ -212,6 +244,20 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Error during browser manager shutdown: {e}")
 
+    try:
+        await browser_pool.close()
+    except Exception as e:
+        logger.error(f"Error during browser pool shutdown: {e}")
+
+    try:
+        await stop_playwright()
+    except Exception as e:
+        logger.error(f"Error stopping playwright: {e}")
+
+    await close_http_client()
+    await close_static_http_client()
+    close_pool()
+
 
 app = FastAPI(lifespan=lifespan)
 
@@ -225,39 +271,46 @@ app.add_middleware(
 
 
 async def batch_process(params: PostJobsParams, tailor: bool = False):
-    batch_size = 5
     total = len(params.urls)
 
-    all_results = []
+    # Bounded fan-out: a slow URL only holds its own slot instead of stalling
+    # a whole fixed-size batch.
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
 
-    # Process in batches
-    for batch_idx in range(0, total, batch_size):
-        # Get the current batch of URLs
-        urls_batch = params.urls[batch_idx : batch_idx + batch_size]
-
-        logger.info(
-            f"Processing batch {batch_idx // batch_size + 1} of {(total + batch_size - 1) // batch_size}"
+    # Placeholder rows for the whole batch in one round trip; they satisfy the
+    # conversations FK and show progress until each URL's result replaces them.
+    summary = "Tailor in progress" if tailor else "Application in progress"
+    with Txc() as tx:
+        tx.insert_jobs(
+            [placeholder_job(url, summary) for url in params.urls], params.resume_id
         )
 
-        # Create tasks for this batch
+    async def _one(idx: int, url: str):
         if tailor:
-            tasks = [
-                tailor_for_url(batch_idx + idx, url, total, params.resume_id)
-                for idx, url in enumerate(urls_batch)
-            ]
-        else:
-            tasks = [
-                apply_for_url(batch_idx + idx, url, total, params.resume_id)
-                for idx, url in enumerate(urls_batch)
-            ]
-
-        # Wait for all tasks in this batch to complete
-        results = await asyncio.gather(*tasks)
-        all_results.extend(results)
+            # The slot is released before the PDF conversion, so LibreOffice
+            # runs while the next URL loads instead of holding up the batch
+            return await tailor_for_url(
+                idx, url, total, params.resume_id, slot=semaphore
+            )
+        async with semaphore:
+            return await apply_for_url(idx, url, total, params.resume_id)
 
-        logger.info(f"Batch {batch_idx // batch_size + 1} completed")
+    logger.info(f"Processing {total} URLs with concurrency {BATCH_CONCURRENCY}")
+    all_results = await asyncio.gather(
+        *[_one(idx, url) for idx, url in enumerate(params.urls)],
+        return_exceptions=True,
+    )
+    logger.info(f"Processed {total} URLs")
 
-    return all_results
+    # The handlers record their own failures; anything that still escapes
+    # (e.g. the DB write in their except block) fails only that URL.
+    results = []
+    for url, result in zip(params.urls, all_results):
+        if isinstance(result, Exception):
+            logger.error(f"Unhandled error processing {url}: {result}")
+            result = {"success": False, "reason": str(result)} if tailor else False
+        results.append(result)
+    return results
 
 
 @app.post("/tailortojobs")
@@ -296,7 +349,7 @@ async def apply_for_jobs(params: PostJobsParams):
     """
     Submit job applications with real-time monitoring.
 
-    Up to APPLICATION_POOL_SIZE (3) run concurrently; the rest wait for a slot.
+    Up to APPLICATION_POOL_SIZE (default 3) run concurrently; the rest wait for a slot.
     Frontend can connect to /stream/{session_id} for real-time updates.
     """
     params.urls = _sanitize_urls(params.urls)
@@ -307,43 +360,42 @@ async def apply_for_jobs(params: PostJobsParams):
         if user_email:
             tx.insert_fetched_urls(params.urls, user_email, params.resume_id, 'apply')
 
+    today = today_str()
+    rows = []
     for url in params.urls:
         session_id = str(uuid.uuid4())
-        today = datetime.now().strftime("%Y-%m-%d")
-        screenshot_dir = f"data/applications/{today}/screenshots/{session_id}"
-
-        try:
-            with Txc() as tx:
-                placeholder_job = Job(
-                    url=url,
-                    role="Processing",
-                    company_name="Processing",
-                    date_posted=None,
-                    cloud="aws",
-                    resume_score=0.0,
-                    job_match_summary="Application in progress",
-                    date_applied=datetime.now(),
-                    jd_filepath=None,
-                    resume_filepath=None,
-                    application_qnas=None,
-                )
-                tx.insert_apply_placeholder(placeholder_job, params.resume_id)
-                tx.create_application_session(
-                    session_id=session_id,
-                    job_url=url,
-                    resume_id=params.resume_id,
-                    status="queued",
-                    screenshot_dir=screenshot_dir,
-                )
+        rows.append(
+            {
+                "session_id": session_id,
+                "job_url": url,
+                "resume_id": params.resume_id,
+                "status": "queued",
+                "screenshot_dir": f"data/applications/{today}/screenshots/{session_id}",
+            }
+        )
 
-            sessions.append({"session_id": session_id, "url": url, "status": "queued"})
+    # Placeholders + sessions for every URL in one transaction
+    try:
+        with Txc() as tx:
+            tx.insert_apply_placeholders(
+                [placeholder_job(url, "Application in progress") for url in params.urls],
+                params.resume_id,
+            )
+            tx.create_application_sessions(rows)
+    except Exception as e:
+        logger.error(f"Error creating sessions: {e}")
+        return {
+            "sessions": [
+                {"session_id": row["session_id"], "url": row["job_url"], "status": "failed", "error": str(e)}
+                for row in rows
+            ]
+        }
 
-            # Launch concurrently — semaphore limits to APPLICATION_POOL_SIZE at once
-            asyncio.create_task(_run_pooled(session_id, url, params.resume_id))
+    for row in rows:
+        sessions.append({"session_id": row["session_id"], "url": row["job_url"], "status": "queued"})
 
-        except Exception as e:
-            logger.error(f"Error creating session for {url}: {e}")
-            sessions.append({"session_id": session_id, "url": url, "status": "failed", "error": str(e)})
+        # Launch concurrently — semaphore limits to APPLICATION_POOL_SIZE at once
+        _spawn(_run_pooled(row["session_id"], row["job_url"], params.resume_id))
 
     return {"sessions": sessions}
 
@@ -351,21 +403,21 @@ async def apply_for_jobs(params: PostJobsParams):
 @app.get("/sessions")
 async def list_sessions(date: Optional[date] = None, email: Optional[str] = None):
     """List job application sessions, optionally filtered by date and user email."""
-    with Txc() as tx:
+    with TxcRO() as tx:
         sessions = tx.list_application_sessions(date, user_email=email)
     return sessions
 
 
 @app.get("/jobs")
 async def get_jobs(date: Optional[date] = None, email: Optional[str] = None) -> list[Job]:
-    with Txc() as tx:
-        jobs = tx.list_jobs(date=date, user_email=email)
-    return [Job(**job) for job in jobs]
+    # Validate rows as they stream in instead of holding every raw row first
+    with TxcRO() as tx:
+        return [Job(**job) for job in tx.iter_jobs(date=date, user_email=email)]
 
 
 @app.get("/fetched-urls")
 async def get_fetched_urls(date: Optional[date] = None, email: Optional[str] = None):
-    with Txc() as tx:
+    with TxcRO() as tx:
         rows = tx.list_fetched_urls(date, user_email=email)
     return [dict(r) for r in rows]
 
@@ -412,7 +464,7 @@ async def get_resume_details(resume_id: int) -> Resume:
 
 @app.get("/list-resumes")
 async def list_resume_ids(email: Optional[str] = None) -> list[int]:
-    with Txc() as tx:
+    with TxcRO() as tx:
         saved_resumes = tx.list_resumes(user_email=email)
     return [resume["id"] for resume in saved_resumes]
 
@@ -425,7 +477,7 @@ async def get_answers(params: QuestionRequest) -> ApplicationAnswers:
 @app.post("/search-jobs")
 async def run_search(params: SearchParams) -> list[str]:
     """Query discovered jobs from the internal DB. Use role as keyword filter, ats_sites as domain filter."""
-    with Txc() as tx:
+    with TxcRO() as tx:
         urls = tx.query_discovered_jobs(
             role=params.role or None,
             ats_sites=params.ats_sites or None,
@@ -436,14 +488,14 @@ async def run_search(params: SearchParams) -> list[str]:
 @app.post("/search-jobs/run-now")
 async def trigger_job_search():
     """Manually trigger the scheduled job search immediately (runs in background)."""
-    asyncio.create_task(_execute_job_search())
+    _spawn(_execute_job_search())
     return {"message": "Job search triggered"}
 
 
 @app.get("/search-terms")
 async def list_search_terms(email: Optional[str] = None):
     """List search terms, optionally filtered by user email."""
-    with Txc() as tx:
+    with TxcRO() as tx:
         terms = tx.get_search_terms(user_email=email)
     return [dict(t) for t in terms]
 
@@ -546,13 +598,13 @@ async def save_user(contact: Contact):
 @app.get("/user-form")
 async def get_user_form(email: str):
     """Fetch saved user application data"""
-    with Txc() as tx:
+    with TxcRO() as tx:
         data = tx.get_user_data(email)
     if not data:
         raise HTTPException(status_code=404, detail="No application data found")
     # Pre-fill years_of_experience from resume if not manually set
     if not data.get("years_of_experience"):
-        with Txc() as tx2:
+        with TxcRO() as tx2:
             resumes = tx2.list_resumes(user_email=email)
             if resumes:
                 job_exps = tx2.list_job_exps(resumes[0]["id"])
@@ -565,7 +617,7 @@ async def get_user_form(email: str):
 @app.get("/profile/yoe")
 async def profile_yoe(email: str):
     """Returns calculated years of experience from resume job dates."""
-    with Txc() as tx:
+    with TxcRO() as tx:
         resumes = tx.list_resumes(user_email=email)
         if not resumes:
             return {"years_of_experience": 0}
@@ -576,7 +628,7 @@ async def profile_yoe(email: str):
 @app.get("/profile/completion")
 async def profile_completion(email: str):
     """Returns profile completion status for the user."""
-    with Txc() as tx:
+    with TxcRO() as tx:
         has_data = tx.has_user_data(email)
         resumes = tx.list_resumes(user_email=email)
     has_resume = len(resumes) > 0
@@ -611,7 +663,7 @@ async def stream_events(session_id: str):
     async def event_generator():
         try:
             while True:
-                event = await queue.get()
+                event = await sse_manager.next_event(session_id, queue)
                 if event is None:  # End signal
                     break
 
@@ -650,7 +702,7 @@ async def get_screenshot(session_id: str, filename: str):
         if created_at:
             date_str = created_at.strftime("%Y-%m-%d")
         else:
-            date_str = datetime.now().strftime("%Y-%m-%d")
+            date_str = today_str()
         screenshot_dir = f"data/applications/{date_str}/screenshots/{session_id}"
 
     screenshot_path = os.path.join(screenshot_dir, filename)
@@ -659,7 +711,18 @@ async def get_screenshot(session_id: str, filename: str):
     if not os.path.exists(screenshot_path):
         raise HTTPException(status_code=404, detail="Screenshot not found")
 
-    return FileResponse(screenshot_path, media_type="image/png")
+    media_type = "image/png" if filename.endswith(".png") else "image/jpeg"
+    return FileResponse(screenshot_path, media_type=media_type)
+
+
+@app.post("/sessions/{session_id}/close")
+async def close_session_view(session_id: str):
+    """
+    Acknowledge a finished session so its browser tab is released
+    without waiting out the final-state display delay.
+    """
+    sse_manager.request_close(session_id)
+    return {"status": "closing", "message": "Session view closed"}
 
 
 @app.post("/sessions/{session_id}/pause")
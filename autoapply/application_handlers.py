@@ -6,9 +6,10 @@ import uuid
 from datetime import datetime, timezone
 from fastapi import HTTPException
 
+from autoapply.env import POSTAPPLY_HOLD_SECONDS, QUESTION_BATCH_WINDOW_MS
 from autoapply.services.db import Txc
 from autoapply.logging import get_logger
-from autoapply.utils import read
+from autoapply.utils import read, today_str
 from autoapply.services.llm import (
     BrowserTools,
     ResumeParserAgent,
@@ -18,45 +19,125 @@ from autoapply.services.llm import (
 from autoapply.resapp_ops import tailor_resume, apply, get_jd_path, ScreeningRejectedError, _quick_fetch_text, _screen_job
 from autoapply.models import (
     ApplicationAnswers,
-    Certification,
-    Contact,
-    Education,
     Job,
-    JobExperience,
     Resume,
-    Skills,
 )
 
 get_logger()
 logger = logging.getLogger(__name__)
 
 
-async def get_application_answers(url: str, questions: str) -> ApplicationAnswers:
-    with Txc() as tx:
-        data = tx.get_jd_resume(url)
+# url -> questions waiting to share one LLM call, and the callers awaiting them
+_pending_questions: dict[str, list[tuple[list[str], asyncio.Future]]] = {}
+# Strong references so running batches aren't garbage-collected
+_batch_tasks: set[asyncio.Task] = set()
 
-    if not data:
-        raise HTTPException(
-            status_code=404,
-            detail="Job not found for this URL. Tailor or apply to it first to enable Q&A.",
-        )
 
-    if not data["jd_path"]:
-        raise HTTPException(
-            status_code=400,
-            detail="Job description not yet available. Tailor or apply to this job first.",
-        )
+async def get_application_answers(
+    url: str, questions: str | list[str]
+) -> ApplicationAnswers:
+    """
+    Answer application questions for a job. Calls for the same URL that arrive
+    within QUESTION_BATCH_WINDOW_MS are answered by a single LLM call.
 
-    if not data["resume_id"]:
-        raise HTTPException(status_code=404, detail="No resume associated with this job.")
+    Args:
+        url: Job URL that was tailored or applied to
+        questions: One question or a list of questions
 
-    jd = await read(data["jd_path"])
+    Returns:
+        ApplicationAnswers for this caller's questions
+    """
+    if isinstance(questions, str):
+        questions = [questions]
+    future = asyncio.get_running_loop().create_future()
+
+    batch = _pending_questions.get(url)
+    if batch is None:
+        # The batch runs in its own task, so no single caller going away
+        # (e.g. a client disconnect) cancels it for the others
+        batch = _pending_questions[url] = []
+        task = asyncio.create_task(_answer_batch(url, batch))
+        _batch_tasks.add(task)
+        task.add_done_callback(_batch_tasks.discard)
+    batch.append((questions, future))
+    return await future
+
+
+async def _answer_batch(
+    url: str, batch: list[tuple[list[str], asyncio.Future]]
+):
+    """Collect a URL's questions for the batch window, then answer them in one call."""
+    try:
+        await asyncio.sleep(QUESTION_BATCH_WINDOW_MS / 1000)
+    finally:
+        del _pending_questions[url]
+
+    # Cancelled callers' futures are already done; don't ask their questions
+    batch = [(qs, waiter) for qs, waiter in batch if not waiter.done()]
+    if not batch:
+        return
+    all_questions = [q for qs, _ in batch for q in qs]
+    if len(batch) > 1:
+        logger.debug(f"Answering {len(all_questions)} questions for {url} in one call")
 
+    try:
+        answers = await _answer_questions(url, all_questions)
+    except BaseException as e:
+        for _, waiter in batch:
+            if waiter.done():
+                continue
+            if isinstance(e, asyncio.CancelledError):
+                waiter.cancel()
+            else:
+                waiter.set_exception(e)
+        if isinstance(e, asyncio.CancelledError):
+            raise
+        return
+
+    for (_, waiter), part in zip(batch, _split_answers(answers, batch)):
+        if not waiter.done():
+            waiter.set_result(part)
+
+
+def _split_answers(
+    answers: ApplicationAnswers, batch: list[tuple[list[str], asyncio.Future]]
+) -> list[ApplicationAnswers]:
+    """Hand each caller the answers to its own questions (all of them if unsure)."""
+    if len(answers.all_answers) != sum(len(qs) for qs, _ in batch):
+        return [answers] * len(batch)
+    parts, start = [], 0
+    for qs, _ in batch:
+        parts.append(ApplicationAnswers(all_answers=answers.all_answers[start : start + len(qs)]))
+        start += len(qs)
+    return parts
+
+
+async def _answer_questions(url: str, questions: list[str]) -> ApplicationAnswers:
+    # Both lookups share one transaction; the LLM call runs outside it
     with Txc() as tx:
+        data = tx.get_jd_resume(url)
+
+        if not data:
+            raise HTTPException(
+                status_code=404,
+                detail="Job not found for this URL. Tailor or apply to it first to enable Q&A.",
+            )
+
+        if not data["jd_path"]:
+            raise HTTPException(
+                status_code=400,
+                detail="Job description not yet available. Tailor or apply to this job first.",
+            )
+
+        if not data["resume_id"]:
+            raise HTTPException(status_code=404, detail="No resume associated with this job.")
+
         global_resume_path = tx.get_resume_path(data["resume_id"])
 
-    path = "/".join(data["jd_path"].split(".")[0].split("/")[:-1])
-    resume_file = global_resume_path.split("/")[-1]
+    jd = await read(data["jd_path"])
+
+    path = os.path.dirname(data["jd_path"])
+    resume_file = os.path.basename(global_resume_path)
     resume_path = os.path.join(path, resume_file)
     if os.path.exists(resume_path):
         resume = await read(resume_path)
@@ -68,118 +149,72 @@ async def get_application_answers(url: str, questions: str) -> ApplicationAnswer
     answers = await question_agent.answer_questions(
         resume=resume,
         job_description=jd,
-        questions=[questions],
+        questions=questions,
     )
 
     if answers is None:
         raise HTTPException(status_code=500, detail="Agent failed to generate answers. Please try again.")
 
+    # Keep the answers with the job, keyed by question
+    try:
+        with Txc() as tx:
+            tx.merge_qnas({a.questions: a.answer for a in answers.all_answers}, url)
+    except Exception as e:
+        logger.warning(f"Failed to save answers for {url}: {e}")
+
     return answers
 
 
-async def tailor_for_url(idx: int, url: str, total: int, resume_id: int):
+def placeholder_job(url: str, job_match_summary: str, status: str = "Processing") -> Job:
+    """Job row shown while a URL is being tailored/applied, or once it failed."""
+    return Job(
+        url=url,
+        role=status,
+        company_name=status,
+        date_posted=None,
+        cloud="aws",
+        resume_score=0.0,
+        job_match_summary=job_match_summary,
+        date_applied=datetime.now(),
+        jd_filepath=None,
+        resume_filepath=None,
+        application_qnas=None,
+    )
+
+
+async def tailor_for_url(idx: int, url: str, total: int, resume_id: int, slot=None):
     logger.info(url)
     logger.info(f"Processing {idx + 1} of {total}")
     session_id = str(uuid.uuid4())
 
+    # The placeholder job row (needed by the conversations FK) is inserted
+    # for the whole batch up front by the caller.
     try:
-        # Insert placeholder job first to satisfy foreign key constraint for conversations table
-        with Txc() as tx:
-            placeholder_job = Job(
-                url=url,
-                role="Processing",
-                company_name="Processing",
-                date_posted=None,
-                cloud="aws",
-                resume_score=0.0,
-                job_match_summary="Tailor in progress",
-                date_applied=datetime.now(),
-                jd_filepath=None,
-                resume_filepath=None,
-                application_qnas=None,
-            )
-            tx.insert_job(placeholder_job, resume_id)
-
-        job, agent_data = await tailor_resume(url, resume_id)
+        job, agent_data = await tailor_resume(url, resume_id, slot=slot)
 
+        # Job row and conversation in one transaction
         with Txc() as tx:
-            # Update job with real data
             logger.debug(f"Written {job.jd_filepath} to db")
-            tx.insert_job(job, resume_id)
-
-            # Get user email from resume
-            user_email = tx.get_user_email_by_resume(resume_id)
-
-            # Save conversation to database
-            if user_email and agent_data:
-                tx.insert_conversation(
-                    session_id=session_id,
-                    user_email=user_email,
-                    job_url=url,
-                    endpoint="tailortojobs",
-                    agent_type="ResumeTailorAgent",
-                    messages=agent_data["messages"],
-                    usage_metrics=agent_data["usage"],
-                    iterations=agent_data["iterations"],
-                    success=agent_data["success"],
-                    error_message=agent_data["error"],
-                )
+            tx.record_apply_result(
+                job, resume_id, session_id, agent_data,
+                endpoint="tailortojobs", agent_type="ResumeTailorAgent",
+            )
         return {"success": True, "reason": None}
 
     except ScreeningRejectedError as e:
         logger.info(f"Screening rejected {url}: {e}")
         with Txc() as tx:
-            tx.insert_job(
-                Job(
-                    url=url,
-                    role="Screened Out",
-                    company_name="Screened Out",
-                    date_posted=None,
-                    cloud="aws",
-                    resume_score=0.0,
-                    job_match_summary=str(e),
-                    date_applied=datetime.now(),
-                    jd_filepath=None,
-                    resume_filepath=None,
-                    application_qnas=None,
-                ),
-                resume_id,
-            )
+            tx.insert_job(placeholder_job(url, str(e), "Screened Out"), resume_id)
         return {"success": False, "reason": str(e)}
 
     except Exception as e:
         logger.error(f"Error tailoring resume: {e}")
         with Txc() as tx:
-            tx.insert_job(
-                Job(
-                    url=url,
-                    role="Failed",
-                    company_name="Failed",
-                    date_posted=None,
-                    cloud="aws",
-                    resume_score=0.0,
-                    job_match_summary=str(e),
-                    date_applied=datetime.now(),
-                    jd_filepath=None,
-                    resume_filepath=None,
-                    application_qnas=None,
-                ),
-                resume_id,
+            tx.record_apply_result(
+                placeholder_job(url, str(e), "Failed"), resume_id, session_id, None,
+                endpoint="tailortojobs", agent_type="ResumeTailorAgent",
+                error_message=str(e),
             )
-            user_email = tx.get_user_email_by_resume(resume_id)
-            if user_email:
-                tx.insert_conversation(
-                    session_id=session_id,
-                    user_email=user_email,
-                    job_url=url,
-                    endpoint="tailortojobs",
-                    agent_type="ResumeTailorAgent",
-                    messages=[],
-                    usage_metrics={},
-                    iterations=0,
-                    success=False,
-                    error_message=str(e),
-                )
 
         return {"success": False, "reason": str(e)}
 
@@ -189,68 +224,29 @@ async def apply_for_url(idx: int, url: str, total: int, resume_id: int):
     logger.info(f"Processing {idx + 1} of {total}")
     session_id = str(uuid.uuid4())
 
+    # The placeholder job row (needed by the conversations FK) is inserted
+    # for the whole batch up front by the caller.
     try:
-        # Insert placeholder job first to satisfy foreign key constraint for conversations table
-        with Txc() as tx:
-            placeholder_job = Job(
-                url=url,
-                role="Processing",
-                company_name="Processing",
-                date_posted=None,
-                cloud="aws",
-                resume_score=0.0,
-                job_match_summary="Application in progress",
-                date_applied=datetime.now(),
-                jd_filepath=None,
-                resume_filepath=None,
-                application_qnas=None,
-            )
-            tx.insert_job(placeholder_job, resume_id)
-
         job, agent_data = await apply(url, resume_id, session_id)
 
+        # Job row and conversation in one transaction
         with Txc() as tx:
-            # Update job with real data
             logger.debug(f"Written {job.jd_filepath} to db")
-            tx.insert_job(job, resume_id)
-
-            # Get user email from resume
-            user_email = tx.get_user_email_by_resume(resume_id)
-
-            # Save conversation to database
-            if user_email:
-                tx.insert_conversation(
-                    session_id=session_id,
-                    user_email=user_email,
-                    job_url=url,
-                    endpoint="applytojobs",
-                    agent_type="JobApplicationAgent",
-                    messages=agent_data["messages"],
-                    usage_metrics=agent_data["usage"],
-                    iterations=agent_data["iterations"],
-                    success=agent_data["success"],
-                    error_message=agent_data["error"],
-                )
+            tx.record_apply_result(
+                job, resume_id, session_id, agent_data,
+                endpoint="applytojobs", agent_type="JobApplicationAgent",
+            )
         return True
 
     except Exception as e:
         logger.error(f"Error applying for resume: {e}")
         # Try to save failed conversation
         with Txc() as tx:
-            user_email = tx.get_user_email_by_resume(resume_id)
-            if user_email:
-                tx.insert_conversation(
-                    session_id=session_id,
-                    user_email=user_email,
-                    job_url=url,
-                    endpoint="applytojobs",
-                    agent_type="JobApplicationAgent",
-                    messages=[],
-                    usage_metrics={},
-                    iterations=0,
-                    success=False,
-                    error_message=str(e),
-                )
+            tx.record_apply_result(
+                None, resume_id, session_id, None,
+                endpoint="applytojobs", agent_type="JobApplicationAgent",
+                job_url=url, error_message=str(e),
+            )
 
         return False
 
@@ -278,38 +274,7 @@ async def parse_resume(path: str) -> int:
 
 async def list_resume(resume_id: int) -> Resume:
     with Txc() as tx:
-        contact = tx.list_contact(resume_id)
-        if not contact:
-            raise RuntimeError(f"{resume_id} not found in database")
-        contact_obj = Contact(**contact[0])
-
-        summary = tx.get_summary(resume_id)
-        if summary:
-            summary_obj = summary
-        else:
-            raise RuntimeError("No summary found")
-        job_exps = tx.list_job_exps(resume_id)
-        job_exps_obj = [JobExperience(**job_exp) for job_exp in job_exps]
-
-        skills = tx.list_skills(resume_id)
-        skills_obj = [Skills(**skill) for skill in skills]
-
-        education = tx.list_education(resume_id)
-        education_obj = [Education(**education) for education in education]
-
-        certifications = tx.list_certifications(resume_id)
-        certification_obj = [
-            Certification(**certification) for certification in certifications
-        ]
-
-    return Resume(
-        contact=contact_obj,
-        summary=summary_obj,
-        job_exp=job_exps_obj,
-        skills=skills_obj,
-        education=education_obj,
-        certifications=certification_obj,
-    )
+        return tx.get_resume_model(resume_id)
 
 
 async def apply_with_streaming(
@@ -334,10 +299,17 @@ async def apply_with_streaming(
         browser_manager: BrowserManager instance for tab management
     """
     try:
-        # Update status to running
+        # Update status to running and load everything the run needs up front
         with Txc() as tx:
             tx.update_session_status(session_id, "running")
             candidate_data = tx.get_candidate_data(resume_id)
+            session = tx.get_application_session(session_id)
+            if not session:
+                raise RuntimeError(f"Session: {session_id} not found")
+        screenshot_dir = (
+            session.get("screenshot_dir")
+            or f"data/applications/{today_str()}/screenshots/{session_id}"
+        )
 
         # Pre-screen before allocating a browser tab
         jd_text = _quick_fetch_text(url)
@@ -362,16 +334,6 @@ async def apply_with_streaming(
         with Txc() as tx:
             tx.update_session_tab_index(session_id, tab_index)
 
-        # Get screenshot directory from database
-        with Txc() as tx:
-            session = tx.get_application_session(session_id)
-            if not session:
-                raise RuntimeError(f"Session: {session_id} not found")
-            screenshot_dir = session.get(
-                "screenshot_dir",
-                f"data/applications/{datetime.now().strftime('%Y-%m-%d')}/screenshots/{session_id}",
-            )
-
         # Create streaming agent
         tools = BrowserTools(page, session_id=session_id)
         agent = StreamingJobApplicationAgent(
@@ -409,29 +371,20 @@ async def apply_with_streaming(
         # Save to database
         final_status = "completed" if result.success else "failed"
         failure_reason = result.reason_of_failure if not result.success else None
+        agent_data = {
+            "messages": agent.messages,
+            "usage": agent.result.usage,
+            "iterations": agent.result.iterations,
+            "success": result.success,
+            "error": failure_reason,
+        }
         with Txc() as tx:
-            # Update existing job record
             logger.debug(f"Written {job.jd_filepath} to db")
-            tx.insert_job(job, resume_id)
             tx.update_session_status(session_id, final_status, error=failure_reason)
-
-            # Get user email for conversation save
-            user_email = tx.get_user_email_by_resume(resume_id)
-
-            # Save conversation
-            if user_email:
-                tx.insert_conversation(
-                    session_id=session_id,
-                    user_email=user_email,
-                    job_url=url,
-                    endpoint="applytojobs",
-                    agent_type="StreamingJobApplicationAgent",
-                    messages=agent.messages,
-                    usage_metrics=agent.result.usage,
-                    iterations=agent.result.iterations,
-                    success=result.success,
-                    error_message=failure_reason,
-                )
+            tx.record_apply_result(
+                job, resume_id, session_id, agent_data,
+                endpoint="applytojobs", agent_type="StreamingJobApplicationAgent",
+            )
 
         # Send completion event
         await sse_manager.send_event(
@@ -443,14 +396,23 @@ async def apply_with_streaming(
                     "message": "Application submitted successfully" if result.success else f"Application failed: {failure_reason}",
                     "role": result.role,
                     "company": result.company_name,
+                    "close_after_ms": POSTAPPLY_HOLD_SECONDS * 1000,
                 },
             },
         )
 
         logger.info(f"Application {final_status} for session {session_id}" + (f": {failure_reason}" if failure_reason else ""))
 
-        # Close tab after delay (keep visible for 30s so user can see final state)
-        await asyncio.sleep(30)
+        # Keep the final state visible until the viewer acks/leaves, at most
+        # POSTAPPLY_HOLD_SECONDS (no wait at all when nobody is watching)
+        if POSTAPPLY_HOLD_SECONDS > 0:
+            try:
+                await asyncio.wait_for(
+                    sse_manager.wait_for_close(session_id),
+                    timeout=POSTAPPLY_HOLD_SECONDS,
+                )
+            except asyncio.TimeoutError:
+                pass
         await browser_manager.close_tab(session_id)
         await sse_manager.remove_stream(session_id)
 
@@ -494,20 +456,11 @@ async def apply_with_streaming(
         # Save failed conversation
         try:
             with Txc() as tx:
-                user_email = tx.get_user_email_by_resume(resume_id)
-                if user_email:
-                    tx.insert_conversation(
-                        session_id=session_id,
-                        user_email=user_email,
-                        job_url=url,
-                        endpoint="applytojobs",
-                        agent_type="StreamingJobApplicationAgent",
-                        messages=[],
-                        usage_metrics={},
-                        iterations=0,
-                        success=False,
-                        error_message=str(e),
-                    )
+                tx.record_apply_result(
+                    None, resume_id, session_id, None,
+                    endpoint="applytojobs", agent_type="StreamingJobApplicationAgent",
+                    job_url=url, error_message=str(e),
+                )
         except Exception as conv_error:
             logger.error(f"Failed to save failed conversation: {conv_error}")
 
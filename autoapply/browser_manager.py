@@ -7,7 +7,10 @@ import asyncio
 import logging
 from typing import Dict, Tuple, Optional
 
-from playwright.async_api import async_playwright, Browser, Page, Playwright
+from playwright.async_api import Browser, Page, Playwright
+
+import autoapply.playwright_patches  # noqa: F401
+from autoapply.playwright_runtime import get_playwright
 
 logger = logging.getLogger(__name__)
 
@@ -27,7 +30,7 @@ class BrowserManager:
         Browser runs in non-headless mode for VNC viewing.
         """
         try:
-            self.playwright = await async_playwright().start()
+            self.playwright = await get_playwright()
             self.browser = await self.playwright.chromium.launch(
                 headless=False,
                 args=[
@@ -55,12 +58,13 @@ class BrowserManager:
             if not self.browser:
                 raise RuntimeError("Browser not initialized. Call initialize() first.")
 
-            # Create new page/tab
-            page = await self.browser.new_page()
+            # Each session gets its own context (isolated cookies/storage) in
+            # the shared browser process, closed together with its tab
+            context = await self.browser.new_context()
+            page = await context.new_page()
 
             # Get tab index (position in browser's page list)
-            all_pages = self.browser.contexts[0].pages
-            tab_index = all_pages.index(page)
+            tab_index = self._all_pages().index(page)
 
             # Store mapping
             self.tabs[session_id] = (page, tab_index)
@@ -91,7 +95,7 @@ class BrowserManager:
             if not self.browser:
                 raise RuntimeError("Browser not initialized")
 
-            all_pages = self.browser.contexts[0].pages
+            all_pages = self._all_pages()
             if 0 <= tab_index < len(all_pages):
                 await all_pages[tab_index].bring_to_front()
                 logger.info(f"Focused tab {tab_index}")
@@ -108,15 +112,23 @@ class BrowserManager:
             session_id: Session identifier whose tab to close
         """
         async with self.lock:
-            if session_id in self.tabs:
-                page, tab_index = self.tabs[session_id]
-                try:
-                    await page.close()
-                    logger.info(f"Closed tab {tab_index} for session {session_id}")
-                except Exception as e:
-                    logger.warning(f"Error closing tab for session {session_id}: {e}")
-                finally:
-                    del self.tabs[session_id]
+            await self._close_tab(session_id)
+
+    async def _close_tab(self, session_id: str):
+        """Close a session's tab and its context. Caller holds the lock."""
+        if session_id in self.tabs:
+            page, tab_index = self.tabs[session_id]
+            try:
+                await page.context.close()
+                logger.info(f"Closed tab {tab_index} for session {session_id}")
+            except Exception as e:
+                logger.warning(f"Error closing tab for session {session_id}: {e}")
+            finally:
+                del self.tabs[session_id]
+
+    def _all_pages(self) -> list[Page]:
+        """Open pages across every session context, in creation order."""
+        return [page for context in self.browser.contexts for page in context.pages]
 
     async def shutdown(self):
         """
@@ -126,17 +138,15 @@ class BrowserManager:
         async with self.lock:
             # Close all tabs
             for session_id in list(self.tabs.keys()):
-                await self.close_tab(session_id)
+                await self._close_tab(session_id)
 
             # Close browser
             if self.browser:
                 await self.browser.close()
                 logger.info("Browser closed")
 
-            # Stop playwright
-            if self.playwright:
-                await self.playwright.stop()
-                logger.info("Playwright stopped")
+            # The shared playwright driver is stopped by the app lifespan
+            self.playwright = None
 
     def get_active_sessions(self) -> list[str]:
         """
@@ -0,0 +1,226 @@
+"""
+Browser Pool for the background scrape/apply paths.
+Keeps one Chromium process alive and hands out a fresh context per job, so
+callers get isolation without paying a browser launch on every URL.
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional
+
+from playwright.async_api import (
+    Browser,
+    BrowserContext,
+    Page,
+    Playwright,
+)
+
+import autoapply.playwright_patches  # noqa: F401
+from autoapply.playwright_runtime import get_playwright
+from autoapply.env import (
+    BROWSER_POOL_IDLE_TIMEOUT_SECONDS,
+    BROWSER_POOL_MAX_AGE_SECONDS,
+    BROWSER_POOL_MAX_CONTEXTS,
+    BROWSER_POOL_RECYCLE_AFTER,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class BrowserPool:
+    """
+    Lazily launched shared browser that is recycled after a number of
+    contexts or once it gets too old, with a cap on open contexts. An idle
+    browser is closed after idle_timeout_seconds and relaunched on demand.
+    """
+
+    def __init__(
+        self,
+        recycle_after: int = BROWSER_POOL_RECYCLE_AFTER,
+        max_age_seconds: float = BROWSER_POOL_MAX_AGE_SECONDS,
+        max_contexts: int = BROWSER_POOL_MAX_CONTEXTS,
+        idle_timeout_seconds: float = BROWSER_POOL_IDLE_TIMEOUT_SECONDS,
+    ):
+        self.playwright: Optional[Playwright] = None
+        self.browser: Optional[Browser] = None
+        self.recycle_after = recycle_after
+        self.max_age_seconds = max_age_seconds
+        self.contexts_served = 0
+        self.launched_at = 0.0
+        self.active: Dict[Browser, int] = {}  # browser -> open contexts
+        self.lock = asyncio.Lock()
+        self.slots = asyncio.Semaphore(max_contexts)
+        self.idle_timeout_seconds = idle_timeout_seconds
+        self._idle_timer: Optional[asyncio.Task] = None
+
+    async def _launch(self):
+        if not self.playwright:
+            self.playwright = await get_playwright()
+        self.browser = await self.playwright.chromium.launch(
+            headless=False,
+            args=[
+                "--no-sandbox",
+                "--disable-dev-shm-usage",
+                "--disable-gpu",
+                # One renderer per tab instead of per cross-site frame
+                "--disable-features=IsolateOrigins,site-per-process",
+            ],
+        )
+        self.contexts_served = 0
+        self.launched_at = time.monotonic()
+        self.active[self.browser] = 0
+        logger.info("Browser pool launched a new browser")
+
+    async def _retire(self, browser: Browser):
+        """Close a browser once none of its contexts are still open."""
+        if self.active.get(browser, 0) == 0:
+            self.active.pop(browser, None)
+            try:
+                await browser.close()
+            except Exception as e:
+                logger.warning(f"Error closing pooled browser: {e}")
+
+    async def _ensure_browser(self) -> Browser:
+        """Launch, or replace a disconnected/worn-out browser. Caller holds the lock."""
+        if self._idle_timer:
+            self._idle_timer.cancel()
+            self._idle_timer = None
+        if self.browser and (
+            not self.browser.is_connected()
+            or self.contexts_served >= self.recycle_after
+            or time.monotonic() - self.launched_at >= self.max_age_seconds
+        ):
+            old, self.browser = self.browser, None
+            await self._retire(old)
+        if not self.browser:
+            await self._launch()
+        return self.browser
+
+    async def get_browser(self) -> Browser:
+        """
+        Return the shared browser, launching or recycling it as needed.
+
+        Returns:
+            Running Browser instance
+        """
+        async with self.lock:
+            return await self._ensure_browser()
+
+    async def prewarm(self, contexts: int = 1):
+        """
+        Launch the browser ahead of the first job and cycle a few contexts
+        through it so the renderer/GPU processes are already up.
+        Failures are logged, not raised; the first real job will retry.
+
+        Args:
+            contexts: Number of throwaway contexts to open and close
+        """
+        try:
+            for _ in range(contexts):
+                async with self.context():
+                    pass
+            # Warm-up contexts shouldn't count toward recycling
+            async with self.lock:
+                self.contexts_served = 0
+            logger.info(f"Browser pool prewarmed with {contexts} contexts")
+        except Exception as e:
+            logger.warning(f"Browser pool prewarm failed: {e}")
+
+    @asynccontextmanager
+    async def context(self, **kwargs) -> AsyncIterator[BrowserContext]:
+        """
+        Open an isolated context on the shared browser and close it on exit.
+        Waits for a free slot when max_contexts are already open.
+
+        Args:
+            **kwargs: Passed through to Browser.new_context()
+
+        Yields:
+            BrowserContext for a single job
+        """
+        async with self.slots:
+            async with self._open_context(**kwargs) as context:
+                yield context
+
+    @asynccontextmanager
+    async def page(self, **kwargs) -> AsyncIterator[Page]:
+        """
+        Open a page in a fresh pooled context.
+
+        Args:
+            **kwargs: Passed through to Browser.new_context()
+
+        Yields:
+            Page for a single job
+        """
+        async with self.context(**kwargs) as context:
+            yield await context.new_page()
+
+    @asynccontextmanager
+    async def _open_context(self, **kwargs) -> AsyncIterator[BrowserContext]:
+        async with self.lock:
+            browser = await self._ensure_browser()
+            self.contexts_served += 1
+            self.active[browser] = self.active.get(browser, 0) + 1
+
+        context = None
+        try:
+            context = await browser.new_context(**kwargs)
+            yield context
+        finally:
+            if context:
+                try:
+                    await context.close()
+                except Exception as e:
+                    logger.warning(f"Error closing browser context: {e}")
+            async with self.lock:
+                if browser in self.active:  # not already torn down by close()
+                    self.active[browser] -= 1
+                    if browser is not self.browser:
+                        await self._retire(browser)
+                    elif self.active[browser] == 0 and self.idle_timeout_seconds > 0:
+                        self._idle_timer = asyncio.create_task(self._close_when_idle())
+
+    async def _close_when_idle(self):
+        """
+        Close the shared browser if no context is opened before the timeout.
+        A prewarmed browser that hasn't served a job yet is kept, or the
+        warm-up would be thrown away on a server that starts idle.
+        """
+        await asyncio.sleep(self.idle_timeout_seconds)
+        async with self.lock:
+            browser = self.browser
+            if browser and self.active.get(browser, 0) == 0 and self.contexts_served > 0:
+                self.browser = None
+                self._idle_timer = None
+                await self._retire(browser)
+                logger.info("Browser pool closed its idle browser")
+
+    async def close(self):
+        """
+        Close every pooled browser; the shared driver is stopped separately.
+        Called during application shutdown.
+        """
+        async with self.lock:
+            if self._idle_timer:
+                self._idle_timer.cancel()
+                self._idle_timer = None
+            for browser in list(self.active):
+                try:
+                    await browser.close()
+                except Exception as e:
+                    logger.warning(f"Error closing pooled browser: {e}")
+            self.active.clear()
+            self.browser = None
+            self.playwright = None
+            logger.info("Browser pool stopped")
+
+
+browser_pool = BrowserPool()
+
+
+async def get_browser() -> Browser:
+    """Shared browser from the module-level pool."""
+    return await browser_pool.get_browser()
@@ -0,0 +1,186 @@
+"""
+Cookie consent handling shared by every Playwright flow that reads job pages.
+"""
+
+import asyncio
+import logging
+import os
+import re
+import time
+import weakref
+from typing import Optional
+from urllib.parse import urlsplit
+
+from playwright.async_api import BrowserContext, Error as PlaywrightError
+
+from autoapply.env import STORAGE_STATE_DIR, STORAGE_STATE_TTL_SECONDS
+
+logger = logging.getLogger(__name__)
+
+
+# Cookie consent buttons from the common consent managers. Id/attribute
+# selectors are specific and cheap to match, so they are checked first.
+_COOKIE_SELECTORS_FAST: tuple[str, ...] = (
+    "#onetrust-accept-btn-handler",  # OneTrust
+    "#accept-cookies",
+    ".accept-cookies",
+    "[data-testid='cookie-accept']",
+    "[data-testid='accept-all-cookies']",
+    ".cookie-consent-accept",
+    ".cookies-accept-all",
+    # By aria-label
+    "[aria-label*='Accept']",
+    "[aria-label*='Agree']",
+)
+
+# Fallback: any button whose whole label is one of the usual consent phrases.
+# Anchored so that e.g. "Do not accept" is never clicked.
+_COOKIE_TEXT_PATTERN = re.compile(
+    r"^\s*(accept(?:\s+all)?(?:\s+cookies)?(?:\s+and\s+continue)?|i\s+agree|agree"
+    r"|allow\s+all|got\s+it|consent|confirm\s+my\s+choices|ok)\s*$",
+    re.I,
+)
+
+# How long to watch the DOM for a banner injected after page load
+_COOKIE_WAIT_MS = 2000
+# Longest to wait for a clicked banner to disappear
+_COOKIE_CLOSE_MS = 500
+
+# Runs in the page: find and click a consent button in one round-trip. If none
+# is present yet, a MutationObserver re-checks (throttled) until the deadline.
+_CLICK_CONSENT_JS = """
+([selectors, pattern, flags, timeoutMs, closeMs]) => new Promise((resolve) => {
+    const re = new RegExp(pattern, flags);
+    const visible = (el) =>
+        el.isConnected &&
+        el.getClientRects().length > 0 && getComputedStyle(el).visibility !== "hidden";
+    // Resolve once the clicked banner is gone (or after closeMs) rather than
+    // sleeping a fixed time on the Python side
+    const clickAndWait = (el, label) => {
+        el.click();
+        const deadline = Date.now() + closeMs;
+        const poll = () => {
+            if (!visible(el) || Date.now() >= deadline) return resolve(label);
+            setTimeout(poll, 50);
+        };
+        poll();
+        return label;
+    };
+    const tryClick = () => {
+        for (const s of selectors) {
+            for (const el of document.querySelectorAll(s)) {
+                if (visible(el)) return clickAndWait(el, s);
+            }
+        }
+        for (const el of document.querySelectorAll("button, [role='button']")) {
+            const label = (el.innerText || "").trim();
+            if (re.test(label) && visible(el)) return clickAndWait(el, `text: ${label}`);
+        }
+        return null;
+    };
+
+    if (tryClick()) return;
+    if (timeoutMs <= 0) return resolve(null);
+
+    let pending = false;
+    const stop = () => { observer.disconnect(); clearTimeout(timer); };
+    const observer = new MutationObserver(() => {
+        if (pending) return;
+        pending = true;
+        setTimeout(() => {
+            pending = false;
+            if (tryClick()) stop();
+        }, 100);
+    });
+    observer.observe(document.documentElement, { childList: true, subtree: true });
+    const timer = setTimeout(() => { stop(); resolve(null); }, timeoutMs);
+})
+"""
+_CLICK_CONSENT_ARGS = [
+    list(_COOKIE_SELECTORS_FAST),
+    _COOKIE_TEXT_PATTERN.pattern,
+    "i",
+    _COOKIE_WAIT_MS,
+    _COOKIE_CLOSE_MS,
+]
+
+# Origins already checked in each browser context. The consent choice is
+# stored in that context's cookies, so later pages on the same site skip
+# the check (and its wait for a late banner) entirely.
+_checked_origins: "weakref.WeakKeyDictionary[BrowserContext, set[str]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+async def handle_cookie_popup(page):
+    """
+    Try to accept cookie consent popups using common patterns.
+    Returns True if a popup was found and clicked, False otherwise.
+    """
+    parts = urlsplit(page.url)
+    origin = f"{parts.scheme}://{parts.netloc}" if parts.netloc else None
+    checked = _checked_origins.setdefault(page.context, set())
+    if origin in checked:
+        logger.debug(f"Cookie popup already handled for {origin}")
+        return False
+
+    try:
+        clicked = await page.evaluate(_CLICK_CONSENT_JS, _CLICK_CONSENT_ARGS)
+    except PlaywrightError as e:
+        # Page navigated or closed mid-check
+        logger.debug(f"Cookie popup check failed: {e}")
+        return False
+
+    if origin:
+        checked.add(origin)
+
+    if not clicked:
+        logger.debug("No cookie popup found or already accepted")
+        return False
+
+    logger.info("Clicked cookie consent button: %s", clicked)
+    return True
+
+
+def _storage_state_path(url: str) -> str:
+    host = re.sub(r"[^\w.-]", "_", urlsplit(url).netloc) or "_"
+    return os.path.join(STORAGE_STATE_DIR, f"{host}.json")
+
+
+def saved_storage_state(url: str) -> Optional[str]:
+    """
+    Storage state saved for the URL's host, so a new context starts with the
+    consent cookies already set and the banner never shows.
+
+    Args:
+        url: Page about to be opened
+
+    Returns:
+        Path to pass as new_context(storage_state=...), or None if there is
+        no state for the host or it is older than STORAGE_STATE_TTL_SECONDS
+    """
+    path = _storage_state_path(url)
+    try:
+        if time.time() - os.path.getmtime(path) < STORAGE_STATE_TTL_SECONDS:
+            return path
+    except OSError:
+        pass
+    return None
+
+
+async def save_storage_state(context: BrowserContext, url: str):
+    """
+    Save the context's cookies and local storage for the URL's host.
+    Failures are logged, not raised.
+
+    Args:
+        context: Context the cookie banner was just accepted in
+        url: URL the context was opened for
+    """
+    path = _storage_state_path(url)
+    try:
+        await asyncio.to_thread(os.makedirs, STORAGE_STATE_DIR, exist_ok=True)
+        await context.storage_state(path=path)
+        logger.debug(f"Saved storage state to {path}")
+    except (OSError, PlaywrightError) as e:
+        logger.warning(f"Could not save storage state for {url}: {e}")
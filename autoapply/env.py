@@ -9,8 +9,44 @@ DB_USER = os.getenv("DB_USER")
 DB_PASSWORD = os.getenv("DB_PASSWORD")
 DB_HOST = os.getenv("DB_HOST")
 DB_PORT = os.getenv("DB_PORT")
+# Connections kept open by the Postgres pool behind Txc
+DB_POOL_MIN = int(os.getenv("DB_POOL_MIN", "1"))
+DB_POOL_MAX = int(os.getenv("DB_POOL_MAX", "20"))
+# Optional read replica for read-only transactions (TxcRO); unset reads from DB_HOST
+DB_READ_HOST = os.getenv("DB_READ_HOST")
+# Server-side prepared statements for hot queries (turn off behind a transaction-mode pooler)
+DB_PREPARED_STATEMENTS = os.getenv("DB_PREPARED_STATEMENTS", "1") == "1"
+# Bulk URL inserts at least this large are streamed with COPY instead of multi-row INSERTs
+DB_COPY_THRESHOLD = int(os.getenv("DB_COPY_THRESHOLD", "1000"))
 APPLICATIONS_DIR = "data/applications"
 
+# Background scrape/apply browser is relaunched after this many contexts
+BROWSER_POOL_RECYCLE_AFTER = int(os.getenv("BROWSER_POOL_RECYCLE_AFTER", "100"))
+# ...or once it has been running this long
+BROWSER_POOL_MAX_AGE_SECONDS = int(os.getenv("BROWSER_POOL_MAX_AGE_SECONDS", "1800"))
+# ...or once it has had no open contexts for this long (0 keeps it running)
+BROWSER_POOL_IDLE_TIMEOUT_SECONDS = int(os.getenv("BROWSER_POOL_IDLE_TIMEOUT_SECONDS", "600"))
+# Contexts open at once on the background browser; further jobs wait for a slot
+BROWSER_POOL_MAX_CONTEXTS = int(os.getenv("BROWSER_POOL_MAX_CONTEXTS", "4"))
+# Contexts cycled through the pool at startup so the first job skips the cold launch (0 disables)
+BROWSER_POOL_PREWARM = int(os.getenv("BROWSER_POOL_PREWARM", "1"))
+# Skip Playwright's per-call full stack walk (keeps only the calling frame in traces)
+FAST_PLAYWRIGHT = os.getenv("AUTOAPPLY_FAST_PLAYWRIGHT", "0") == "1"
+# Job-board hosts whose pages only render with JavaScript (learned, persisted here)
+JS_HOSTS_PATH = os.getenv("JS_HOSTS_PATH", "data/js_hosts.json")
+# Per-host browser storage state (cookies incl. consent) saved after a cookie banner is accepted
+STORAGE_STATE_DIR = os.getenv("STORAGE_STATE_DIR", "data/state")
+# Saved storage states older than this are ignored
+STORAGE_STATE_TTL_SECONDS = int(os.getenv("STORAGE_STATE_TTL_SECONDS", str(7 * 24 * 3600)))
+# Max URLs tailored/applied at once by a batch request
+BATCH_CONCURRENCY = int(os.getenv("BATCH_CONCURRENCY", str(min(os.cpu_count() or 1, 4))))
+# Max streaming job applications (visible browser tabs) running at the same time
+APPLICATION_POOL_SIZE = int(os.getenv("APPLICATION_POOL_SIZE", "3"))
+# Longest a finished streaming session keeps its tab open for the viewer (0 closes it at once)
+POSTAPPLY_HOLD_SECONDS = int(os.getenv("AUTOAPPLY_POSTAPPLY_HOLD_SEC", "30"))
+# Application questions for the same job arriving within this window share one LLM call
+QUESTION_BATCH_WINDOW_MS = int(os.getenv("QUESTION_BATCH_WINDOW_MS", "200"))
+
 # LLM configuration — defaults to OpenRouter, override for local vLLM
 LLM_BASE_URL = os.getenv("LLM_BASE_URL", "https://openrouter.ai/api/v1")
 MODEL = os.getenv("LLM_MODEL", "anthropic/claude-haiku-4.5")
@@ -25,6 +61,16 @@ if "openrouter.ai" in LLM_BASE_URL and not OPENROUTER_API_KEY:
         "OPENROUTER_API_KEY is not set. Get a key at https://openrouter.ai/keys"
     )
 
+# Response cache for side-effect-free LLM calls (resume parsing, Q&A)
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", "data/cache.db")
+LLM_CACHE_TTL_SECONDS = int(os.getenv("LLM_CACHE_TTL_SECONDS", str(30 * 24 * 3600)))
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "50000"))
+# Near-duplicate job descriptions (cosine similarity of hashed n-grams) reuse cached tailoring
+SEMANTIC_CACHE_PATH = os.getenv("SEMANTIC_CACHE_PATH", "data/semantic_cache.npz")
+SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.95"))
+SEMANTIC_CACHE_MAX_ENTRIES = int(os.getenv("SEMANTIC_CACHE_MAX_ENTRIES", "1000"))
+
 # Google Custom Search API (optional — used for job search when set)
 GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY", "")
 GOOGLE_CSE_ID = os.getenv("GOOGLE_CSE_ID", "")
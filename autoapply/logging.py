@@ -4,9 +4,16 @@ import os
 from datetime import datetime
 
 log_path = "logs"
+_configured = False
 
 
 def get_logger():
+    # Every module calls this at import; only the first call opens a log file
+    global _configured
+    if _configured:
+        return
+    _configured = True
+
     os.makedirs(log_path, exist_ok=True)
     now = datetime.now()
     FORMAT = "%(asctime)s [%(name)s] %(levelname)s %(message)s"
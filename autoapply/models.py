@@ -1,9 +1,40 @@
 from enum import Enum
-from pydantic import BaseModel, EmailStr, Field, field_validator
+from functools import lru_cache
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
 from typing import Literal, Optional
 from datetime import date, datetime
 
 
+@lru_cache(maxsize=1024)
+def _parse_datetime(value: str) -> datetime:
+    return datetime.fromisoformat(value)
+
+
+@lru_cache(maxsize=1024)
+def _parse_date(value: str) -> date:
+    return date.fromisoformat(value)
+
+
+def _cached_datetime(value):
+    """Parse ISO datetime strings through a cache; leave anything else to pydantic."""
+    if isinstance(value, str):
+        try:
+            return _parse_datetime(value)
+        except ValueError:
+            pass
+    return value
+
+
+def _cached_date(value):
+    """Parse ISO date strings through a cache; leave anything else to pydantic."""
+    if isinstance(value, str):
+        try:
+            return _parse_date(value)
+        except ValueError:
+            pass
+    return value
+
+
 class SignupParams(BaseModel):
     name: str
     email: str
@@ -48,6 +79,8 @@ class UploadResumeParams(BaseModel):
 
 
 class Contact(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     name: str
     email: str
     location: str
@@ -58,17 +91,20 @@ class Contact(BaseModel):
 
 
 class Education(BaseModel):
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
+
     degree: str
     major: str
     college: str
     from_: date | None = Field(alias="from_date", default=None)
     to_: date | str | None = Field(alias="to_date", default=None)
 
-    class Config:
-        populate_by_name = True
+    _parse_dates = field_validator("from_", "to_", mode="before")(_cached_date)
 
 
 class JobExperience(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
     job_title: str
     company_name: str
     location: str
@@ -76,22 +112,27 @@ class JobExperience(BaseModel):
     to_: date | str | None = Field(alias="to_date", default=None)
     experience: list[str]
 
-    class Config:
-        populate_by_name = True
+    _parse_dates = field_validator("from_", "to_", mode="before")(_cached_date)
 
 
 class Certification(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     title: str
     obtained_date: date | None = None
     expiry_date: date | None = None
 
 
 class Skills(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     title: str
     skills: str
 
 
 class CompanyExperience(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     company_name: str = Field(
         description="The name of the company as it appears in resume (no role or nothing)"
     )
@@ -114,7 +155,9 @@ class Achievement(BaseModel):
     achieved_date: date | None = Field(default=None, description="Date of achievement")
 
 
-class TailoredResume(BaseModel):
+class _JobCore(BaseModel):
+    """Fields shared by the tailoring LLM output and the stored job post."""
+
     role: str = Field(description="Job roles name")
     company_name: str = Field(description="Name of the company that posted the job")
     date_posted: Optional[datetime] = Field(
@@ -126,6 +169,13 @@ class TailoredResume(BaseModel):
     resume_score: float = Field(
         description="The resume score on a scale of 0 to 100", le=100, ge=0
     )
+
+    _parse_date_posted = field_validator("date_posted", mode="before")(
+        _cached_datetime
+    )
+
+
+class TailoredResume(_JobCore):
     job_match_summary: str = Field(
         description="Explanation of how well the resume does for this JD"
     )
@@ -161,19 +211,10 @@ class AssistedJobApplication(BaseModel):
     )
 
 
-class Job(BaseModel):
+class Job(_JobCore):
+    model_config = ConfigDict(populate_by_name=True)
+
     url: str = Field(description="URL for the job post")
-    role: str = Field(description="Job roles name")
-    company_name: str = Field(description="Name of the company that posted the job")
-    date_posted: Optional[datetime] = Field(
-        description="Job Posted date if mentioned", default=None
-    )
-    cloud: Literal["aws", "gcp", "azu"] = Field(
-        description="The dominant/prefered cloud technology", default="aws"
-    )
-    resume_score: float = Field(
-        description="The resume score on a scale of 0 to 100", le=100, ge=0
-    )
     job_match_summary: str
     date_applied: datetime
     jd_filepath: Optional[str] = Field(alias="jd_path", default=None)
@@ -182,8 +223,33 @@ class Job(BaseModel):
         default=None, description="Agent doesn't have to fill this, it can be null"
     )
 
-    class Config:
-        populate_by_name = True
+    _parse_date_applied = field_validator("date_applied", mode="before")(
+        _cached_datetime
+    )
+
+    @classmethod
+    def from_tailored(
+        cls,
+        tailored: "TailoredResume",
+        *,
+        url: str,
+        date_applied: datetime,
+        jd_filepath: Optional[str],
+        resume_filepath: Optional[str],
+    ) -> "Job":
+        """Build a Job from an already validated TailoredResume without re-validating it."""
+        return cls.model_construct(
+            url=url,
+            role=tailored.role,
+            company_name=tailored.company_name,
+            date_posted=tailored.date_posted,
+            cloud=tailored.cloud,
+            resume_score=tailored.resume_score,
+            job_match_summary=tailored.job_match_summary,
+            date_applied=date_applied,
+            jd_filepath=jd_filepath,
+            resume_filepath=resume_filepath,
+        )
 
 
 class Resume(BaseModel):
@@ -202,6 +268,8 @@ class Resume(BaseModel):
 
 
 class ApplicationAnswer(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     questions: str
     answer: str
 
@@ -212,7 +280,7 @@ class ApplicationAnswers(BaseModel):
 
 class QuestionRequest(BaseModel):
     url: str
-    questions: str
+    questions: str | list[str]
 
 
 class SearchParams(BaseModel):
@@ -0,0 +1,73 @@
+"""
+Optional speed-up for playwright-python's per-call stack capture.
+
+Every Playwright API call walks the whole Python stack (reading each frame's
+locals) to label the call and attach a trace for the driver. Under heavy
+scraping this shows up as a large share of CPU. With AUTOAPPLY_FAST_PLAYWRIGHT=1
+the walk stops at the first non-Playwright frame, so error messages keep their
+API name (e.g. "Page.goto: Timeout ...") but traces only hold the calling frame.
+Leave it off when debugging Playwright traces.
+"""
+
+import importlib
+import logging
+import sys
+
+import playwright
+from playwright._impl import _connection
+
+from autoapply.env import FAST_PLAYWRIGHT
+
+logger = logging.getLogger(__name__)
+
+# Modules that bind _capture_stack_trace by name at import time
+_PATCHED_MODULES = (
+    "playwright._impl._connection",
+    "playwright._impl._disposable",
+    "playwright._impl._network",
+    "playwright._impl._sync_base",
+)
+
+
+def _capture_calling_frame() -> dict:
+    mapping_file = playwright._impl._impl_to_api_mapping.__file__
+    module_path = _connection._PLAYWRIGHT_MODULE_PATH
+    api_name = ""
+    frame = sys._getframe(1)
+    while frame:
+        code = frame.f_code
+        filename = code.co_filename
+        if filename == mapping_file:
+            frame = frame.f_back
+            continue
+        if not filename.startswith(module_path):
+            caller = {
+                "file": filename,
+                "line": frame.f_lineno,
+                "column": 0,
+                "function": code.co_qualname,
+            }
+            return {"frames": [caller], "apiName": api_name, "title": None}
+        api_name = code.co_qualname
+        frame = frame.f_back
+    return {"frames": [], "apiName": api_name, "title": None}
+
+
+def apply():
+    """Install the cheap stack capture if AUTOAPPLY_FAST_PLAYWRIGHT=1."""
+    if not FAST_PLAYWRIGHT:
+        return
+    if not hasattr(_connection, "_capture_stack_trace"):
+        logger.warning(
+            "AUTOAPPLY_FAST_PLAYWRIGHT set but this Playwright version has no "
+            "_capture_stack_trace; leaving it unpatched"
+        )
+        return
+    for name in _PATCHED_MODULES:
+        module = importlib.import_module(name)
+        if hasattr(module, "_capture_stack_trace"):
+            module._capture_stack_trace = _capture_calling_frame
+    logger.info("Playwright stack capture limited to the calling frame")
+
+
+apply()
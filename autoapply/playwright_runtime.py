@@ -0,0 +1,42 @@
+"""
+One Playwright driver for the whole process.
+
+async_playwright().start() spawns a Node driver subprocess; the browser pool
+and the browser manager share a single one instead of starting their own,
+and relaunching a recycled browser doesn't pay for a new driver.
+"""
+
+import asyncio
+import logging
+from typing import Optional
+
+from playwright.async_api import async_playwright, Playwright
+
+logger = logging.getLogger(__name__)
+
+_pw: Optional[Playwright] = None
+_lock: Optional[asyncio.Lock] = None
+
+
+async def get_playwright() -> Playwright:
+    """Start the shared driver on first use and return it."""
+    global _pw, _lock
+    if _pw is not None:
+        return _pw
+    if _lock is None:
+        _lock = asyncio.Lock()
+    async with _lock:
+        if _pw is None:
+            _pw = await async_playwright().start()
+            logger.info("Playwright driver started")
+    return _pw
+
+
+async def stop_playwright():
+    """Stop the shared driver. Called during application shutdown."""
+    global _pw
+    if _pw is None:
+        return
+    pw, _pw = _pw, None
+    await pw.stop()
+    logger.info("Playwright driver stopped")
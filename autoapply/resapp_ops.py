@@ -1,15 +1,28 @@
+import asyncio
+import html
+import httpx
 import logging
 import os
 import re
-import shutil
 import urllib.request
 
-from datetime import datetime, timezone
-from playwright.async_api import async_playwright
+from contextlib import nullcontext
 
-from autoapply.env import APPLICATIONS_DIR
+from datetime import datetime, timezone
+from pathlib import Path
+from urllib.parse import urlparse
+from playwright.async_api import Error as PlaywrightError
+
+from autoapply.browser_pool import browser_pool
+from autoapply.cookies import (
+    handle_cookie_popup,
+    save_storage_state,
+    saved_storage_state,
+)
+from autoapply.env import APPLICATIONS_DIR, JS_HOSTS_PATH
 from autoapply.services.db import Txc
 from autoapply.logging import get_logger
+from autoapply.utils import read, today_str, write
 from autoapply.services.llm import (
     BrowserTools,
     DocumentTools,
@@ -25,6 +38,62 @@ get_logger()
 logger = logging.getLogger(__name__)
 
 
+# Output directories already created by get_jd_path in this process
+_ensured_dirs: set[str] = set()
+
+# Static-HTML fast path for job pages that don't need a browser
+_STATIC_MIN_CHARS = 500
+# Longer pages are cut here before reaching the LLM; a real JD fits well within it
+_JD_MAX_CHARS = 32000
+_DROP_BLOCKS_RE = re.compile(r"<(script|style|noscript|svg)\b[^>]*>.*?</\1>", re.S | re.I)
+_BREAK_TAGS_RE = re.compile(r"<(br|/p|/li|/div|/h[1-6]|/tr)\b[^>]*>", re.I)
+_TAG_RE = re.compile(r"<[^>]+>")
+_SPACES_RE = re.compile(r"[ \t\r\f\v]+")
+_LINE_EDGES_RE = re.compile(r" ?\n ?")
+_BLANK_LINES_RE = re.compile(r"\n\s*\n+")
+_JD_HINT_RE = re.compile(r"responsibilit|qualification|requirement|what you.ll do", re.I)
+_http_client: httpx.AsyncClient | None = None
+_http_client_loop: asyncio.AbstractEventLoop | None = None
+# Hosts where the static fetch came back empty but the browser found the JD;
+# their pages go straight to the browser. Loaded from JS_HOSTS_PATH on first use.
+_js_hosts: set[str] | None = None
+
+# Read only the job-description container instead of the whole <body>: most
+# boards wrap the JD in one of these, and navigation/footers/related-job lists
+# would otherwise be shipped over CDP and on to the LLM. Most specific first.
+_JD_CONTAINER_JS = """
+([selectors, maxChars]) => {
+    // innerText already skips script/style; squeeze the blank-line runs that
+    // layout markup leaves behind before the text crosses CDP
+    const clean = (text) => text.replace(/\\n\\s*\\n+/g, "\\n\\n").trim().slice(0, maxChars);
+    for (const sel of selectors) {
+        const el = document.querySelector(sel);
+        if (el && el.innerText.length > 300) return clean(el.innerText);
+    }
+    return clean(document.body.innerText);
+}
+"""
+_JD_CONTAINER_SELECTORS = [
+    '[data-testid="jobDescription"]',
+    '[data-automation-id="jobPostingDescription"]',
+    '[class*="job-description"]',
+    '[class*="jobDescription"]',
+    '[class*="jobDetails"]',
+    "main",
+    "article",
+]
+_JD_READY_JS = """
+(selectors) => selectors.some((sel) => {
+    const el = document.querySelector(sel);
+    return el && el.innerText.length > 300;
+})
+"""
+_JD_WAIT_MS = 5000
+# Nothing the JD reader looks at; stylesheets stay so innerText still skips
+# hidden elements
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
+
 class ScreeningRejectedError(Exception):
     pass
 
@@ -35,43 +104,50 @@ def _quick_fetch_text(url: str) -> str:
         req = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
         with urllib.request.urlopen(req, timeout=10) as resp:
             html = resp.read().decode("utf-8", errors="ignore")[:150_000]
-        return re.sub(r"<[^>]+>", " ", html)
+        return _TAG_RE.sub(" ", html)
     except Exception:
         return ""
 
 
+# Pre-screening rules, built once instead of on every job
+_NO_SPONSORSHIP_PHRASES = (
+    "no visa sponsorship", "not offer visa", "cannot sponsor",
+    "unable to sponsor", "not provide sponsorship",
+    "sponsorship is not available", "not able to sponsor",
+    "will not sponsor", "must be authorized to work in",
+    "must be eligible to work in the u",
+    "citizens and permanent residents only",
+)
+# Normalise "X-Y years" → "X years" so the lower bound is used as the minimum requirement.
+# e.g. "5-7 years of experience" becomes "5 years of experience" (not 7).
+_YEAR_RANGE_RE = re.compile(r"(\d+)\s*[-\u2013]\s*\d+\s*(years?)")
+_EXPERIENCE_RES = tuple(
+    re.compile(pat)
+    for pat in (
+        r"(\d+)\+?\s*(?:or more\s+)?years?\s+of\s+(?:relevant\s+)?(?:professional\s+)?experience",
+        r"minimum\s+(?:of\s+)?(\d+)\+?\s*years?\s+(?:of\s+)?experience",
+        r"at\s+least\s+(\d+)\+?\s*years?\s+(?:of\s+)?experience",
+        r"(\d+)\+\s*years?\s+experience",
+    )
+)
+
+
 def _screen_job(jd_text: str, candidate_data: dict) -> tuple[bool, str | None]:
     """Returns (passed, reason). If passed=False, reason explains disqualification."""
     text = jd_text.lower()
 
     # Sponsorship check — only when candidate needs sponsorship
     if candidate_data.get("requires_sponsorship"):
-        no_sponsor = [
-            "no visa sponsorship", "not offer visa", "cannot sponsor",
-            "unable to sponsor", "not provide sponsorship",
-            "sponsorship is not available", "not able to sponsor",
-            "will not sponsor", "must be authorized to work in",
-            "must be eligible to work in the u",
-            "citizens and permanent residents only",
-        ]
-        if any(phrase in text for phrase in no_sponsor):
+        if any(phrase in text for phrase in _NO_SPONSORSHIP_PHRASES):
             return False, "Visa sponsorship not available for this role"
 
     # Experience check
     candidate_years = int(candidate_data.get("years_of_experience") or 0)
 
-    # Normalise "X-Y years" → "X years" so the lower bound is used as the minimum requirement.
-    # e.g. "5-7 years of experience" becomes "5 years of experience" (not 7).
-    normalized_text = re.sub(r"(\d+)\s*[-\u2013]\s*\d+\s*(years?)", r"\1 \2", text)
+    normalized_text = _YEAR_RANGE_RE.sub(r"\1 \2", text)
 
-    patterns = [
-        r"(\d+)\+?\s*(?:or more\s+)?years?\s+of\s+(?:relevant\s+)?(?:professional\s+)?experience",
-        r"minimum\s+(?:of\s+)?(\d+)\+?\s*years?\s+(?:of\s+)?experience",
-        r"at\s+least\s+(\d+)\+?\s*years?\s+(?:of\s+)?experience",
-        r"(\d+)\+\s*years?\s+experience",
-    ]
-    for pat in patterns:
-        for m in re.findall(pat, normalized_text):
+    for pattern in _EXPERIENCE_RES:
+        for m in pattern.findall(normalized_text):
             required = int(m)
             # Skip values > 15 — these are company-history numbers (e.g. "85 years in business"),
             # not job requirements.
@@ -84,11 +160,13 @@ def _screen_job(jd_text: str, candidate_data: dict) -> tuple[bool, str | None]:
 
 
 async def get_jd_path(llm: Job):
-    today = datetime.now().strftime("%Y-%m-%d")
+    today = today_str()
 
     # Output directory for tailored resume and JD
     output_dir = os.path.join(APPLICATIONS_DIR, today, llm.company_name)
-    os.makedirs(output_dir, exist_ok=True)
+    if output_dir not in _ensured_dirs:
+        await asyncio.to_thread(os.makedirs, output_dir, exist_ok=True)
+        _ensured_dirs.add(output_dir)
 
     jd_filename = llm.role.replace("/", "")
     return os.path.join(output_dir, f"{jd_filename}.md")
@@ -100,51 +178,165 @@ async def extract_job_description(url: str, page=None) -> str:
 
     Args:
         url: Job posting URL
-        page: Optional existing Playwright page. If None, creates a new browser instance.
+        page: Optional existing Playwright page. If None, opens a context on the
+            shared browser pool.
 
     Returns:
-        Tuple of (title, content, jd_filepath) where jd_filepath is the saved markdown file path
+        Text content of the job posting page
     """
-    close_browser = False
-    browser = None
-
     try:
         if page is None:
-            # Create new browser instance
-            from playwright.async_api import async_playwright
+            host = urlparse(url).netloc
+            js_hosts = await _load_js_hosts()
+            if host not in js_hosts:
+                content = await _fetch_static_text(url)
+                if content:
+                    logger.debug(f"Read JD for {url} without a browser")
+                    return content
+
+            async with browser_pool.page(
+                storage_state=saved_storage_state(url)
+            ) as pooled_page:
+                await pooled_page.route("**/*", _skip_heavy_resources)
+                content = await _read_page_text(pooled_page, url)
+            if host not in js_hosts and len(content) >= _STATIC_MIN_CHARS:
+                await _remember_js_host(host)
+            return content
+        # A caller-owned page may be handed to the apply agent next, which
+        # needs the page rendered as usual
+        return await _read_page_text(page, url)
 
-            p = await async_playwright().__aenter__()
-            browser = await p.chromium.launch(
-                headless=False, args=["--no-sandbox", "--disable-dev-shm-usage"]
-            )
-            page = await browser.new_page()
-            close_browser = True
+    except Exception as e:
+        logger.error(f"Error extracting JD from {url}: {e}")
+        raise
 
-        # Set default timeout
-        page.set_default_timeout(timeout=60000)
 
-        # Navigate to URL
-        await page.goto(url)
+def _html_to_text(raw: str) -> str:
+    raw = _DROP_BLOCKS_RE.sub(" ", raw)
+    raw = _BREAK_TAGS_RE.sub("\n", raw)
+    text = html.unescape(_TAG_RE.sub(" ", raw))
+    text = _LINE_EDGES_RE.sub("\n", _SPACES_RE.sub(" ", text))
+    return _BLANK_LINES_RE.sub("\n\n", text).strip()
 
-        # Handle cookie popup
-        await handle_cookie_popup(page)
 
-        # Wait for page to load
-        await page.wait_for_timeout(5000)
+def _static_http_client() -> httpx.AsyncClient:
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    # A client is tied to the loop it was opened on (scripts may run several)
+    if _http_client is None or _http_client_loop is not loop:
+        _http_client = httpx.AsyncClient(
+            timeout=10.0,
+            follow_redirects=True,
+            headers={"User-Agent": "Mozilla/5.0"},
+        )
+        _http_client_loop = loop
+    return _http_client
 
-        # Get page content
-        content = await page.inner_text("body")
 
-        if close_browser and browser:
-            await browser.close()
+async def close_static_http_client():
+    """Close the job-page HTTP client. Called during application shutdown."""
+    global _http_client, _http_client_loop
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+        _http_client_loop = None
 
-        return content
 
-    except Exception as e:
-        logger.error(f"Error extracting JD from {url}: {e}")
-        if close_browser and browser:
-            await browser.close()
-        raise
+async def _fetch_static_text(url: str) -> str:
+    """
+    Fetch a job page over plain HTTP and return its text if it already holds
+    the job description (server-rendered boards like Greenhouse or Lever).
+    Returns '' when the page needs a browser.
+    """
+    try:
+        response = await _static_http_client().get(url)
+        response.raise_for_status()
+    except httpx.HTTPError as e:
+        logger.debug(f"Static fetch failed for {url}: {e}")
+        return ""
+
+    if "html" not in response.headers.get("content-type", ""):
+        return ""
+
+    text = _html_to_text(response.text)
+    if len(text) < _STATIC_MIN_CHARS or not _JD_HINT_RE.search(text):
+        return ""
+    return text[:_JD_MAX_CHARS]
+
+
+async def _load_js_hosts() -> set[str]:
+    global _js_hosts
+    if _js_hosts is None:
+        try:
+            _js_hosts = set(await read(JS_HOSTS_PATH))
+        except (OSError, ValueError) as e:
+            if not isinstance(e, FileNotFoundError):
+                logger.warning(f"Ignoring unreadable {JS_HOSTS_PATH}: {e}")
+            _js_hosts = set()
+    return _js_hosts
+
+
+async def _remember_js_host(host: str):
+    _js_hosts.add(host)
+    logger.debug(f"{host} needs a browser; skipping the static fetch from now on")
+    try:
+        await write(JS_HOSTS_PATH, sorted(_js_hosts))
+    except ValueError as e:
+        logger.warning(str(e))
+
+
+async def _skip_heavy_resources(route):
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def _wait_for_jd(page):
+    waits = [
+        asyncio.ensure_future(
+            page.wait_for_function(
+                _JD_READY_JS, arg=_JD_CONTAINER_SELECTORS, timeout=_JD_WAIT_MS
+            )
+        ),
+        asyncio.ensure_future(
+            page.wait_for_load_state("networkidle", timeout=_JD_WAIT_MS)
+        ),
+    ]
+    try:
+        # A wait that errors (timeout, context destroyed by a redirect) just
+        # leaves it to the other one
+        for finished in asyncio.as_completed(waits):
+            try:
+                await finished
+                break
+            except PlaywrightError:
+                continue
+    finally:
+        for task in waits:
+            task.cancel()
+        await asyncio.gather(*waits, return_exceptions=True)
+
+
+async def _read_page_text(page, url: str) -> str:
+    # Set default timeout
+    page.set_default_timeout(timeout=60000)
+
+    # Navigate to URL; the JD is usually rendered long before "load" fires
+    await page.goto(url, wait_until="domcontentloaded")
+
+    # Read as soon as a JD container has rendered, or the network goes idle
+    # on pages without a known container; give up waiting after 5s.
+    await _wait_for_jd(page)
+
+    # Handle cookie popup; keep the accepted consent for the next context
+    if await handle_cookie_popup(page):
+        await save_storage_state(page.context, url)
+
+    # Get page content
+    return await page.evaluate(
+        _JD_CONTAINER_JS, [_JD_CONTAINER_SELECTORS, _JD_MAX_CHARS]
+    )
 
 
 async def apply(url: str, resume_id: int, session_id: str) -> tuple[Job, dict]:
@@ -156,12 +348,7 @@ async def apply(url: str, resume_id: int, session_id: str) -> tuple[Job, dict]:
         with Txc() as tx:
             candidate_data = tx.get_candidate_data(resume_id)
 
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(
-                headless=False, args=["--no-sandbox", "--disable-dev-shm-usage"]
-            )
-            page = await browser.new_page()
-
+        async with browser_pool.page(storage_state=saved_storage_state(url)) as page:
             # Now apply with the agent
             tools = BrowserTools(page)
             jobs_agent = JobApplicationAgent(tools)
@@ -170,15 +357,7 @@ async def apply(url: str, resume_id: int, session_id: str) -> tuple[Job, dict]:
             logger.debug(f"Results from ApplyAgent: {result}")
 
             # Capture agent conversation data
-            agent_data = {
-                "messages": jobs_agent.messages,
-                "usage": jobs_agent.result.usage,
-                "iterations": jobs_agent.result.iterations,
-                "success": jobs_agent.result.success,
-                "error": jobs_agent.result.error,
-            }
-
-            await browser.close()
+            agent_data = _agent_data(jobs_agent)
 
             jd_filepath = await get_jd_path(result)
 
@@ -204,58 +383,29 @@ async def apply(url: str, resume_id: int, session_id: str) -> tuple[Job, dict]:
         raise RuntimeError(f"Error occured {e} while applying for {url}")
 
 
-async def handle_cookie_popup(page):
-    """
-    Try to accept cookie consent popups using common patterns.
-    Returns True if a popup was found and clicked, False otherwise.
-    """
-    # Common selectors and text patterns for cookie consent buttons
-    selectors_to_try = [
-        # By button text (most common)
-        "button:has-text('Accept')",
-        "button:has-text('Accept all')",
-        "button:has-text('Accept All')",
-        "button:has-text('Accept all and continue')",
-        "button:has-text('I agree')",
-        "button:has-text('I Agree')",
-        "button:has-text('Agree')",
-        "button:has-text('OK')",
-        "button:has-text('Got it')",
-        "button:has-text('Allow all')",
-        "button:has-text('Consent')",
-        "button:has-text('Confirm My Choices')"
-        # By common IDs and classes
-        "#onetrust-accept-btn-handler",  # OneTrust
-        "#accept-cookies",
-        ".accept-cookies",
-        "[data-testid='cookie-accept']",
-        "[data-testid='accept-all-cookies']",
-        ".cookie-consent-accept",
-        ".cookies-accept-all",
-        # By aria-label
-        "[aria-label*='Accept']",
-        "[aria-label*='Agree']",
-    ]
+def _agent_data(agent) -> dict:
+    """Conversation data stored alongside a job for one agent run."""
+    return {
+        "messages": agent.messages,
+        "usage": agent.result.usage,
+        "iterations": agent.result.iterations,
+        "success": agent.result.success,
+        "error": agent.result.error,
+    }
 
-    for selector in selectors_to_try:
-        try:
-            # Wait up to 2 seconds for this selector
-            button = await page.wait_for_selector(
-                selector, timeout=2000, state="visible"
-            )
-            if button:
-                await button.click()
-                logger.info(f"Clicked cookie consent button: {selector}")
-                await page.wait_for_timeout(500)  # Wait for popup to close
-                return True
-        except Exception:
-            continue  # Try next selector
 
-    logger.debug("No cookie popup found or already accepted")
-    return False
+def _store_outputs(
+    doc: DocumentTools, resume_name: str, jd_filepath: str, role: str, url: str, content: str
+):
+    doc.save(resume_name)
+
+    Path(jd_filepath).write_text(
+        f"# {role}\n\nSource: {url}\n\n---\n\n{content}", encoding="utf-8"
+    )
 
 
-async def tailor_resume(url: str, resume_id: int) -> None:
+async def _draft_resume(url: str, resume_id: int) -> tuple:
+    """Read the JD, tailor the resume and write both; returns what the PDF step needs."""
     try:
         # Extract and save job description using shared function
         content = await extract_job_description(url)
@@ -266,6 +416,7 @@ async def tailor_resume(url: str, resume_id: int) -> None:
     # Pre-screening (after content extraction, before agent)
     with Txc() as tx:
         candidate_data = tx.get_candidate_data(resume_id)
+        resume_path = tx.get_resume_path(resume_id)
     passed, reason = _screen_job(content, candidate_data)
     if not passed:
         raise ScreeningRejectedError(reason)
@@ -277,45 +428,30 @@ async def tailor_resume(url: str, resume_id: int) -> None:
         # Reading resume to compare
         logger.debug(f"Reading resume: {resume_id}")
 
-        with Txc() as tx:
-            resume_path = tx.get_resume_path(resume_id)
-
         if resume_path:
-            resume_file = resume_path.split("/")[-1]
-            tmp = f"/tmp/{datetime.now().strftime('%H%M%S%f')}"
-            os.makedirs(tmp, exist_ok=True)
-            tmp_path = os.path.join(tmp, resume_file)
-            shutil.copy(resume_path, tmp_path)
-            logger.debug(f"Resume copied from {resume_path} to {tmp_path}")
+            resume_file = os.path.basename(resume_path)
+
+            # Edits stay in memory and are written once, straight to the
+            # output dir, instead of copy -> save per edit -> move.
+            doc = await asyncio.to_thread(DocumentTools, resume_path, False)
 
             # Extract JD details and tailor resume (LLM Call)
-            doc = DocumentTools(tmp_path)
             tailor_agent = ResumeTailorAgent(document_tools=doc)
             llm = await tailor_agent.tailor_resume(content)
             logger.debug("Job details extracted!")
 
             # Capture agent conversation data
-            agent_data = {
-                "messages": tailor_agent.messages,
-                "usage": tailor_agent.result.usage,
-                "iterations": tailor_agent.result.iterations,
-                "success": tailor_agent.result.success,
-                "error": tailor_agent.result.error,
-            }
+            agent_data = _agent_data(tailor_agent)
 
             # Output directory for tailored resume and JD
             jd_filepath = await get_jd_path(llm)
-            output_dir = "/".join(jd_filepath.split("/")[:-1])
+            output_dir = os.path.dirname(jd_filepath)
             resume_name = os.path.join(output_dir, resume_file)
             logger.debug(f"Resume written to {output_dir}")
-            shutil.move(tmp_path, resume_name)
-
-            with open(jd_filepath, "w", encoding="utf-8") as f:
-                f.write(f"# {llm.role}\n\n")
-                f.write(f"Source: {url}\n\n")
-                f.write("---\n\n")
-                f.write(content)
-                logger.debug(f"JD written to {output_dir}")
+            await asyncio.to_thread(
+                _store_outputs, doc, resume_name, jd_filepath, llm.role, url, content
+            )
+            logger.debug(f"JD written to {output_dir}")
         else:
             raise RuntimeError(f"No resume found for {resume_id}")
 
@@ -323,6 +459,26 @@ async def tailor_resume(url: str, resume_id: int) -> None:
         logger.error(f"Error: {e}\nwhile LLM comparing JD and resume for {url}")
         raise
 
+    return llm, agent_data, jd_filepath, resume_name
+
+
+async def tailor_resume(url: str, resume_id: int, slot=None) -> tuple[Job, dict]:
+    """
+    Tailor the resume for a job and convert the result to PDF.
+
+    Args:
+        url: Job posting URL
+        resume_id: Resume to tailor
+        slot: Optional async context manager (e.g. a batch semaphore) held
+            while the JD is read and the resume tailored, and released before
+            the PDF conversion so the next job can start meanwhile
+
+    Returns:
+        (job, agent_data), or (None, None) if the final stage fails
+    """
+    async with slot or nullcontext():
+        llm, agent_data, jd_filepath, resume_name = await _draft_resume(url, resume_id)
+
     try:
         logger.debug(f"Converting {resume_name} to pdf")
         resume_pdf = await convert_docx_to_pdf(resume_name)
@@ -333,9 +489,8 @@ async def tailor_resume(url: str, resume_id: int) -> None:
 
         # Saving new data
         now_utc = datetime.now(timezone.utc)
-        llm_data = llm.model_dump()
-        job = Job(
-            **llm_data,
+        job = Job.from_tailored(
+            llm,
             url=url,
             date_applied=now_utc,
             jd_filepath=jd_filepath,
@@ -1,27 +1,79 @@
+import atexit
+import copy
+import csv
+import functools
+import io
 import logging
+import re
+import threading
+import time
 import psycopg2
+import pydantic_core
 
-from psycopg2.extras import RealDictCursor, Json
+from psycopg2.extras import RealDictCursor, Json, execute_values
+from psycopg2.pool import PoolError, ThreadedConnectionPool
 from datetime import datetime
 from contextlib import contextmanager
 from datetime import date
-from typing import Optional, Union
-
-from autoapply.env import DB_HOST, DB_PORT, DB_NAME, DB_USER, DB_PASSWORD
+from typing import Iterator, Optional, Union
+
+from autoapply.env import (
+    DB_COPY_THRESHOLD,
+    DB_HOST,
+    DB_NAME,
+    DB_PASSWORD,
+    DB_POOL_MAX,
+    DB_POOL_MIN,
+    DB_PORT,
+    DB_PREPARED_STATEMENTS,
+    DB_READ_HOST,
+    DB_USER,
+)
 from autoapply.models import (
+    Certification,
     Contact,
+    Education,
     Job,
+    JobExperience,
     Resume,
+    Skills,
     UserOnboarding,
 )
 from autoapply.logging import get_logger
 
 # Build connection string
 CONNINFO = f"host={DB_HOST} port={DB_PORT} dbname={DB_NAME} user={DB_USER} password={DB_PASSWORD}"
+# TxcRO reads go to the replica when one is configured, else to the primary
+READ_CONNINFO = (
+    f"host={DB_READ_HOST} port={DB_PORT} dbname={DB_NAME} user={DB_USER} password={DB_PASSWORD}"
+    if DB_READ_HOST
+    else None
+)
 
 get_logger()
 logger = logging.getLogger(__name__)
 
+# Per-resume lookups reused across applies: (kind, resume_id) -> (expires_at, value).
+# Cleared after any transaction that writes users/resumes/user_data commits; the
+# TTL only bounds staleness from writers in other processes.
+RESUME_CACHE_TTL_SECONDS = 300
+RESUME_CACHE_MAX_ENTRIES = 256
+_resume_cache: dict[tuple[str, int], tuple[float, object]] = {}
+_resume_cache_lock = threading.Lock()
+# Bumped on every invalidation; a load that started under an older version
+# may have read pre-commit rows and is returned but not cached.
+_resume_cache_version = 0
+
+_CONTACT_FIELDS = ("name", "email", "phone", "country_code", "linkedin", "github", "location")
+
+
+def invalidate_resume_cache():
+    """Drop every cached resume/candidate lookup."""
+    global _resume_cache_version
+    with _resume_cache_lock:
+        _resume_cache.clear()
+        _resume_cache_version += 1
+
 
 def _calc_years_of_experience(job_exps: list[dict]) -> int:
     """Calculate total years of experience by summing actual job durations (excludes gaps)."""
@@ -47,6 +99,131 @@ def _calc_years_of_experience(job_exps: list[dict]) -> int:
     return int(total_days / 365.25)
 
 
+class _Connection(psycopg2.extensions.connection):
+    """
+    Connection that remembers which statements were PREPAREd on it and keeps
+    one dict cursor for every Txc that borrows it.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared: set[str] = set()
+        self.dict_cursor: Optional[RealDictCursor] = None
+
+
+def _parse_end_dates(job_exps: list[dict]):
+    """Turn ISO "to_" strings (JSONB stores dates as text) into dates, in place."""
+    for job in job_exps:
+        to_val = job.get("to_") or job.get("to_date")
+        if isinstance(to_val, str) and to_val.lower() not in ("current", "present"):
+            try:
+                job["to_"] = datetime.strptime(to_val.strip(), "%Y-%m-%d").date()
+            except ValueError:
+                pass
+
+
+_RESUME_RECORD_SQL = """
+    SELECT r.id, r.user_email, r.path, r.summary, r.job_experience,
+           r.education, r.skills, r.certifications, r.projects, r.achievements,
+           u.name, u.email, u.phone, u.country_code, u.linkedin, u.github, u.location,
+           to_jsonb(ud) AS user_data
+    FROM resumes r
+    LEFT JOIN users u ON r.user_email = u.email
+    LEFT JOIN user_data ud ON ud.email = u.email
+"""
+
+
+# Used by get_candidate_data when a resume row has no path
+_DEFAULT_RESUME_PATH = "data/resumes/aws/shashank_reddy.pdf"
+
+
+def _json_list(value) -> list:
+    """A JSONB array column's value, or [] for NULL or any other JSON type."""
+    return value if isinstance(value, list) else []
+
+
+def _resume_record(row) -> dict:
+    record = dict(row)
+    # Once per load rather than on every list_job_exps() of the cached copy
+    if isinstance(record["job_experience"], list):
+        _parse_end_dates(record["job_experience"])
+    return record
+
+
+# Opened on first use so importing this module never touches the database
+_pool: Optional[ThreadedConnectionPool] = None
+_ro_pool: Optional[ThreadedConnectionPool] = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool(readonly: bool = False) -> ThreadedConnectionPool:
+    global _pool, _ro_pool
+    if readonly and READ_CONNINFO:
+        if _ro_pool is None:
+            with _pool_lock:
+                if _ro_pool is None:
+                    _ro_pool = ThreadedConnectionPool(
+                        DB_POOL_MIN, DB_POOL_MAX, READ_CONNINFO, connection_factory=_Connection
+                    )
+        return _ro_pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ThreadedConnectionPool(
+                    DB_POOL_MIN, DB_POOL_MAX, CONNINFO, connection_factory=_Connection
+                )
+    return _pool
+
+
+def close_pool():
+    """Close every pooled connection. Called during application shutdown."""
+    global _pool, _ro_pool
+    with _pool_lock:
+        for pool in (_pool, _ro_pool):
+            if pool is not None:
+                pool.closeall()
+        _pool = _ro_pool = None
+
+
+# Scripts and workers that never run the app lifespan still close their connections
+atexit.register(close_pool)
+
+
+@contextmanager
+def _connection(readonly: bool = False):
+    """Borrow a pooled connection, or open a one-off one if all are in use."""
+    pool = _get_pool(readonly)
+    try:
+        conn = pool.getconn()
+    except PoolError:
+        logger.warning(f"All {DB_POOL_MAX} pooled connections busy; opening a new one")
+        conninfo = READ_CONNINFO if readonly and READ_CONNINFO else CONNINFO
+        conn = psycopg2.connect(conninfo, connection_factory=_Connection)
+        try:
+            yield conn
+        finally:
+            conn.close()
+        return
+
+    try:
+        yield conn
+    finally:
+        # Drop connections that broke mid-transaction instead of reusing them
+        pool.putconn(conn, close=bool(conn.closed))
+
+
+@contextmanager
+def _dict_cursor(conn):
+    """The pooled connection's long-lived dict cursor, or a fresh one otherwise."""
+    if not isinstance(conn, _Connection):
+        with conn.cursor(cursor_factory=RealDictCursor) as cur:
+            yield cur
+        return
+    if conn.dict_cursor is None or conn.dict_cursor.closed:
+        conn.dict_cursor = conn.cursor(cursor_factory=RealDictCursor)
+    yield conn.dict_cursor
+
+
 @contextmanager
 def Txc():
     """
@@ -58,9 +235,196 @@ def Txc():
             repo.insert_weather_reading(...)
         # Auto-commits on success, auto-rollbacks on exception
     """
-    with psycopg2.connect(CONNINFO) as conn:
-        with conn.cursor(cursor_factory=RealDictCursor) as cur:
-            yield AutoApply(cur, conn)
+    with _connection() as conn, conn:
+        with _dict_cursor(conn) as cur:
+            repo = AutoApply(cur, conn)
+            yield repo
+    # Only after commit, so a concurrent reader can't re-cache the old rows
+    if repo.resume_data_changed:
+        invalidate_resume_cache()
+
+
+@contextmanager
+def TxcRO():
+    """
+    Like Txc, for transactions that only read.
+
+    Runs as BEGIN READ ONLY, on the DB_READ_HOST replica when one is
+    configured. Reads may lag the primary slightly there, so keep anything
+    that must see a write it just made on Txc.
+    """
+    with _connection(readonly=True) as conn:
+        # Sent with the BEGIN itself, so no extra round trip
+        conn.readonly = True
+        try:
+            with conn, _dict_cursor(conn) as cur:
+                repo = AutoApply(cur, conn)
+                repo.from_replica = bool(READ_CONNINFO)
+                yield repo
+        finally:
+            if not conn.closed:
+                conn.readonly = None
+
+
+_JOB_COLUMNS = "url, resume_path, role, company_name, date_posted, date_applied, jd_path, resume_id, resume_score, job_match_summary, application_qnas"
+_JOB_VALUES = "(%(url)s, %(resume_path)s, %(role)s, %(company_name)s, %(date_posted)s, DEFAULT, %(jd_path)s, %(resume_id)s, %(resume_score)s, %(job_match_summary)s, %(application_qnas)s)"
+_JOB_ON_CONFLICT_UPDATE = """
+ON CONFLICT (url) DO UPDATE SET
+    role = EXCLUDED.role,
+    company_name = EXCLUDED.company_name,
+    resume_path = EXCLUDED.resume_path,
+    date_posted = EXCLUDED.date_posted,
+    jd_path = EXCLUDED.jd_path,
+    resume_id = EXCLUDED.resume_id,
+    resume_score = EXCLUDED.resume_score,
+    job_match_summary = EXCLUDED.job_match_summary,
+    application_qnas = EXCLUDED.application_qnas
+-- Re-scans mostly write identical rows; skip those updates (and their WAL)
+WHERE (jobs.role, jobs.company_name, jobs.resume_path, jobs.date_posted, jobs.jd_path,
+       jobs.resume_id, jobs.resume_score, jobs.job_match_summary, jobs.application_qnas)
+    IS DISTINCT FROM
+      (EXCLUDED.role, EXCLUDED.company_name, EXCLUDED.resume_path, EXCLUDED.date_posted, EXCLUDED.jd_path,
+       EXCLUDED.resume_id, EXCLUDED.resume_score, EXCLUDED.job_match_summary, EXCLUDED.application_qnas)
+"""
+_UPSERT_JOB_SQL = (
+    f"INSERT INTO jobs ({_JOB_COLUMNS})\nVALUES {_JOB_VALUES}"
+    + _JOB_ON_CONFLICT_UPDATE
+    + "RETURNING url"
+)
+# Multi-row forms for execute_values: the whole batch is one INSERT statement
+_UPSERT_JOBS_SQL = f"INSERT INTO jobs ({_JOB_COLUMNS})\nVALUES %s" + _JOB_ON_CONFLICT_UPDATE
+# Large batches: COPY into a staging table, then one INSERT ... SELECT.
+# date_applied is left out so it takes the jobs table's default.
+_JOB_COPY_COLUMNS = [c for c in _JOB_COLUMNS.split(", ") if c != "date_applied"]
+_COPY_JOBS_SQL = (
+    f"INSERT INTO jobs ({', '.join(_JOB_COPY_COLUMNS)})\n"
+    f"SELECT {', '.join(_JOB_COPY_COLUMNS)} FROM jobs_stage"
+    + _JOB_ON_CONFLICT_UPDATE
+)
+_COPY_JOBS_STAGE_SQL = (
+    f"COPY jobs_stage ({', '.join(_JOB_COPY_COLUMNS)}) FROM STDIN WITH (FORMAT csv)"
+)
+_INSERT_JOBS_IF_NEW_SQL = (
+    f"INSERT INTO jobs ({_JOB_COLUMNS})\nVALUES %s\nON CONFLICT (url) DO NOTHING"
+)
+
+
+def _job_params(job: Job, resume_id: int) -> dict:
+    return {
+        "url": job.url,
+        "resume_path": getattr(job, "resume_filepath", None)
+        or getattr(job, "resume_path", None),
+        "role": job.role,
+        "company_name": job.company_name,
+        "date_posted": job.date_posted,
+        "jd_path": getattr(job, "jd_filepath", None)
+        or getattr(job, "jd_path", None),
+        "resume_id": resume_id,
+        "resume_score": job.resume_score,
+        "job_match_summary": getattr(job, "job_match_summary", None)
+        or getattr(job, "detailed_explanation", None)
+        or "",
+        "application_qnas": _json(job.application_qnas)
+        if hasattr(job, "application_qnas")
+        else _json({}),
+    }
+
+
+def _to_json(obj) -> str:
+    # pydantic-core's serializer: faster than json.dumps, and it handles
+    # models, dates and datetimes without a model_dump() pass first. Field
+    # names, not aliases, as model_dump() wrote them.
+    return pydantic_core.to_json(obj, by_alias=False).decode()
+
+
+def _json(obj) -> Json:
+    """Adapt obj for a JSON/JSONB parameter."""
+    return Json(obj, dumps=_to_json)
+
+
+# Rows per round trip when streaming large results from a server-side cursor
+_STREAM_CHUNK_ROWS = 1000
+
+_NAMED_PARAM_RE = re.compile(r"%\((\w+)\)s")
+
+
+@functools.lru_cache(maxsize=None)
+def _prepared_params(sql: str) -> list[str]:
+    """Distinct %(name)s parameters of a query, in $1..$n order."""
+    return list(dict.fromkeys(_NAMED_PARAM_RE.findall(sql)))
+
+
+_INSERT_CONVERSATION_SQL = """
+INSERT INTO conversations (
+    session_id, user_email, job_url, endpoint, agent_type,
+    messages, usage_metrics, iterations, success, error_message
+)
+VALUES (
+    %(session_id)s, %(user_email)s, %(job_url)s, %(endpoint)s,
+    %(agent_type)s, %(messages)s, %(usage_metrics)s,
+    %(iterations)s, %(success)s, %(error_message)s
+)
+RETURNING id
+"""
+
+_UPSERT_USER_SQL = """
+INSERT INTO users (name, email, phone, country_code, linkedin, github, location)
+VALUES (%(name)s, %(email)s, %(phone)s, %(country_code)s, %(linkedin)s, %(github)s, %(location)s)
+ON CONFLICT (email) DO UPDATE SET
+    name = EXCLUDED.name,
+    phone = EXCLUDED.phone,
+    country_code = EXCLUDED.country_code,
+    linkedin = EXCLUDED.linkedin,
+    github = EXCLUDED.github,
+    location = EXCLUDED.location
+RETURNING email
+"""
+# insert_resume/upsert_resume write the resume and upsert its owner together
+_INSERT_RESUME_SQL = f"""
+WITH upserted_user AS ({_UPSERT_USER_SQL})
+INSERT INTO resumes (id, user_email, path, summary, job_experience, education, skills, certifications, projects, achievements)
+VALUES (DEFAULT, %(user_email)s, %(path)s, %(summary)s, %(job_experience)s, %(education)s, %(skills)s, %(certifications)s, %(projects)s, %(achievements)s)
+RETURNING id
+"""
+_UPDATE_RESUME_SQL = f"""
+WITH upserted_user AS ({_UPSERT_USER_SQL})
+UPDATE resumes
+SET user_email = %(user_email)s,
+    summary = %(summary)s,
+    job_experience = %(job_experience)s,
+    education = %(education)s,
+    skills = %(skills)s,
+    certifications = %(certifications)s,
+    projects = %(projects)s,
+    achievements = %(achievements)s
+WHERE path = %(path)s
+RETURNING id
+"""
+
+
+def _contact_params(contact: Contact) -> dict:
+    return {field: getattr(contact, field) for field in _CONTACT_FIELDS}
+
+
+def _as_json_list(items: list) -> Json:
+    # Models are serialized straight to JSON (dates as ISO strings) by _to_json
+    return _json(list(items))
+
+
+def _resume_params(resume: Resume, path: Optional[str]) -> dict:
+    """Resume columns plus its owner's contact fields (for _UPSERT_USER_SQL)."""
+    return {
+        **_contact_params(resume.contact),
+        "user_email": resume.contact.email,
+        "path": path,
+        "summary": resume.summary,
+        "job_experience": _as_json_list(resume.job_exp),
+        "education": _as_json_list(resume.education),
+        "skills": _as_json_list(resume.skills),
+        "certifications": _as_json_list(resume.certifications),
+        "projects": _as_json_list(resume.projects),
+        "achievements": _as_json_list(resume.achievements),
+    }
 
 
 class AutoApply:
@@ -69,30 +433,97 @@ class AutoApply:
     def __init__(self, cursor, conn):
         self.cursor = cursor
         self.conn = conn
+        self.resume_data_changed = False
+        # Set by TxcRO on a replica, whose rows may predate a committed write
+        self.from_replica = False
+
+    def _execute(self, name: str, sql: str, params: dict):
+        """
+        Run a hot query as a server-side prepared statement, PREPAREd once per
+        pooled connection, so Postgres skips parsing and planning it again.
+        Falls back to a plain execute when disabled or on foreign connections.
+        """
+        if not DB_PREPARED_STATEMENTS or not isinstance(self.conn, _Connection):
+            self.cursor.execute(sql, params)
+            return
+        names = _prepared_params(sql)
+        if name not in self.conn.prepared:
+            body = _NAMED_PARAM_RE.sub(lambda m: f"${names.index(m.group(1)) + 1}", sql)
+            self.cursor.execute(f"PREPARE {name} AS {body}")
+            self.conn.prepared.add(name)
+        try:
+            self.cursor.execute(
+                f"EXECUTE {name} ({', '.join(['%s'] * len(names))})",
+                [params[n] for n in names],
+            )
+        except psycopg2.errors.InvalidSqlStatementName:
+            # Dropped server-side (e.g. DEALLOCATE ALL); prepare again next time
+            self.conn.prepared.discard(name)
+            raise
+
+    def _fetch_column(self, sql: str, params) -> list:
+        """
+        Run a single-column query on a plain tuple cursor, skipping the
+        per-row dict RealDictCursor would build. For queries returning many
+        URLs.
+        """
+        with self.conn.cursor() as cur:
+            cur.execute(sql, params)
+            return [row[0] for row in cur.fetchall()]
+
+    def _cached(self, kind: str, resume_id: int, load):
+        """Serve a per-resume lookup from the process cache, loading it on a miss."""
+        key = (kind, resume_id)
+        now = time.monotonic()
+        with _resume_cache_lock:
+            hit = _resume_cache.get(key)
+            version = _resume_cache_version
+        if hit and hit[0] > now:
+            return copy.deepcopy(hit[1])
+        value = load(resume_id)
+        self._cache_put(key, value, version, now)
+        return copy.deepcopy(value)
+
+    def _cache_put(self, key, value, version: int, now: float) -> None:
+        """Store a loaded value unless a write was committed while it was being read."""
+        if self.from_replica:
+            return
+        with _resume_cache_lock:
+            if version == _resume_cache_version:
+                _resume_cache.pop(key, None)
+                if len(_resume_cache) >= RESUME_CACHE_MAX_ENTRIES:
+                    # Oldest insertion first
+                    _resume_cache.pop(next(iter(_resume_cache)))
+                _resume_cache[key] = (now + RESUME_CACHE_TTL_SECONDS, value)
 
     def insert_apply_placeholder(self, job: Job, resume_id: int) -> None:
         """Insert a placeholder job for apply tracking only if no job record exists yet.
         Uses ON CONFLICT DO NOTHING so tailor results are never overwritten."""
-        self.cursor.execute(
-            """
-            INSERT INTO jobs (url, resume_path, role, company_name, date_posted, date_applied, jd_path, resume_id, resume_score, job_match_summary, application_qnas)
-            VALUES (%(url)s, %(resume_path)s, %(role)s, %(company_name)s, %(date_posted)s, DEFAULT, %(jd_path)s, %(resume_id)s, %(resume_score)s, %(job_match_summary)s, %(application_qnas)s)
-            ON CONFLICT (url) DO NOTHING
-            """,
-            {
-                "url": job.url,
-                "resume_path": None,
-                "role": job.role,
-                "company_name": job.company_name,
-                "date_posted": job.date_posted,
-                "jd_path": None,
-                "resume_id": resume_id,
-                "resume_score": job.resume_score,
-                "job_match_summary": job.job_match_summary,
-                "application_qnas": Json(job.application_qnas)
-                if hasattr(job, "application_qnas")
-                else Json({}),
-            },
+        self.insert_apply_placeholders([job], resume_id)
+
+    def insert_apply_placeholders(self, jobs: list[Job], resume_id: int) -> None:
+        """Bulk version of insert_apply_placeholder: one INSERT for the batch."""
+        execute_values(
+            self.cursor,
+            _INSERT_JOBS_IF_NEW_SQL,
+            [
+                {
+                    "url": job.url,
+                    "resume_path": None,
+                    "role": job.role,
+                    "company_name": job.company_name,
+                    "date_posted": job.date_posted,
+                    "jd_path": None,
+                    "resume_id": resume_id,
+                    "resume_score": job.resume_score,
+                    "job_match_summary": job.job_match_summary,
+                    "application_qnas": _json(job.application_qnas)
+                    if hasattr(job, "application_qnas")
+                    else _json({}),
+                }
+                for job in jobs
+            ],
+            template=_JOB_VALUES,
         )
 
     def insert_job(self, job: Job, resume_id: int) -> str:
@@ -100,45 +531,45 @@ class AutoApply:
         Insert or update job post.
         Returns the URL of the inserted/updated job.
         """
+        self._execute("ap_upsert_job", _UPSERT_JOB_SQL, _job_params(job, resume_id))
+        result = self.cursor.fetchone()
+        # No row back means the stored job already matched, so it exists as is
+        return result["url"] if result else job.url
+
+    def insert_jobs(self, jobs: list[Job], resume_id: int) -> None:
+        """Insert or update several job posts with one multi-row INSERT."""
+        # One statement can't update the same row twice; the last job per URL
+        # wins, as it would with one insert_job per job
+        params = {job.url: _job_params(job, resume_id) for job in jobs}
+        if len(params) >= DB_COPY_THRESHOLD:
+            self._copy_jobs(list(params.values()))
+            return
+        execute_values(
+            self.cursor, _UPSERT_JOBS_SQL, list(params.values()), template=_JOB_VALUES
+        )
+
+    def _copy_jobs(self, rows: list[dict]) -> None:
+        """
+        Large-batch path of insert_jobs: COPY the rows into a staging table,
+        then upsert them with a single INSERT ... SELECT.
+        """
         self.cursor.execute(
             """
-            INSERT INTO jobs (url, resume_path, role, company_name, date_posted, date_applied, jd_path, resume_id, resume_score, job_match_summary, application_qnas)
-            VALUES (%(url)s, %(resume_path)s, %(role)s, %(company_name)s, %(date_posted)s, DEFAULT, %(jd_path)s, %(resume_id)s, %(resume_score)s, %(job_match_summary)s, %(application_qnas)s)
-            ON CONFLICT (url) DO UPDATE SET
-                role = EXCLUDED.role,
-                company_name = EXCLUDED.company_name,
-                resume_path = EXCLUDED.resume_path,
-                date_posted = EXCLUDED.date_posted,
-                jd_path = EXCLUDED.jd_path,
-                resume_id = EXCLUDED.resume_id,
-                resume_score = EXCLUDED.resume_score,
-                job_match_summary = EXCLUDED.job_match_summary,
-                application_qnas = EXCLUDED.application_qnas
-            RETURNING url
-            """,
-            {
-                "url": job.url,
-                "resume_path": getattr(job, "resume_filepath", None)
-                or getattr(job, "resume_path", None),
-                "role": job.role,
-                "company_name": job.company_name,
-                "date_posted": job.date_posted,
-                "jd_path": getattr(job, "jd_filepath", None)
-                or getattr(job, "jd_path", None),
-                "resume_id": resume_id,
-                "resume_score": job.resume_score,
-                "job_match_summary": getattr(job, "job_match_summary", None)
-                or getattr(job, "detailed_explanation", None)
-                or "",
-                "application_qnas": Json(job.application_qnas)
-                if hasattr(job, "application_qnas")
-                else Json({}),
-            },
+            CREATE TEMP TABLE IF NOT EXISTS jobs_stage (LIKE jobs) ON COMMIT DROP;
+            TRUNCATE jobs_stage;
+            """
         )
-        result = self.cursor.fetchone()
-        if not result:
-            raise RuntimeError(f"Failed to insert/update job: {job.url}")
-        return result["url"]
+        buf = io.StringIO()
+        # Only None is left unquoted, which COPY reads as NULL; "" stays ""
+        writer = csv.writer(buf, quoting=csv.QUOTE_NOTNULL)
+        for row in rows:
+            writer.writerow(
+                row[c].dumps(row[c].adapted) if isinstance(row[c], Json) else row[c]
+                for c in _JOB_COPY_COLUMNS
+            )
+        buf.seek(0)
+        self.cursor.copy_expert(_COPY_JOBS_STAGE_SQL, buf)
+        self.cursor.execute(_COPY_JOBS_SQL)
 
     def list_jobs(
         self,
@@ -148,71 +579,67 @@ class AutoApply:
         """
         List jobs, optionally filtered by date applied and/or user email.
         """
+        return list(self.iter_jobs(date=date, user_email=user_email))
+
+    def iter_jobs(
+        self,
+        date: Optional[date] = None,
+        user_email: Optional[str] = None,
+    ) -> Iterator[dict]:
+        """
+        Like list_jobs, but streams rows from a server-side cursor in chunks
+        of _STREAM_CHUNK_ROWS instead of holding the whole result client-side.
+        Must be consumed inside the transaction.
+        """
         conditions = []
         params: dict = {}
         if date:
             from datetime import timedelta
-            conditions.append("j.date_applied::date >= %(date)s AND j.date_applied::date <= %(date_plus1)s")
+            # Half-open range on the raw column, so idx_jobs_date_applied applies
+            conditions.append("j.date_applied >= %(date)s AND j.date_applied < %(date_plus2)s")
             params["date"] = date
-            params["date_plus1"] = date + timedelta(days=1)
+            params["date_plus2"] = date + timedelta(days=2)
         if user_email:
             conditions.append("r.user_email = %(user_email)s")
             params["user_email"] = user_email
 
         where = ("WHERE " + " AND ".join(conditions)) if conditions else ""
         sql = f"""
-            SELECT j.* FROM jobs j
+            SELECT j.url, j.role, j.company_name, j.date_posted, j.date_applied,
+                   j.jd_path, j.resume_path, j.resume_score, j.job_match_summary,
+                   j.application_qnas
+            FROM jobs j
             JOIN resumes r ON j.resume_id = r.id
             {where}
             ORDER BY j.date_applied DESC
         """
-        self.cursor.execute(sql, params)
-        return self.cursor.fetchall()
+        with self.conn.cursor(name="iter_jobs", cursor_factory=RealDictCursor) as cur:
+            cur.itersize = _STREAM_CHUNK_ROWS
+            cur.execute(sql, params)
+            yield from cur
 
     def upsert_user(self, contact: Contact) -> str:
         """
         Insert or update user from resume contact info.
         Returns the user's email.
         """
-        self.cursor.execute(
-            """
-            INSERT INTO users (name, email, phone, country_code, linkedin, github, location)
-            VALUES (%(name)s, %(email)s, %(phone)s, %(country_code)s, %(linkedin)s, %(github)s, %(location)s)
-            ON CONFLICT (email) DO UPDATE SET
-                name = EXCLUDED.name,
-                phone = EXCLUDED.phone,
-                country_code = EXCLUDED.country_code,
-                linkedin = EXCLUDED.linkedin,
-                github = EXCLUDED.github,
-                location = EXCLUDED.location
-            RETURNING email
-            """,
-            {
-                "name": contact.name,
-                "email": contact.email,
-                "phone": contact.phone,
-                "country_code": contact.country_code,
-                "linkedin": contact.linkedin,
-                "github": contact.github,
-                "location": contact.location,
-            },
-        )
+        self.resume_data_changed = True
+        self.cursor.execute(_UPSERT_USER_SQL, _contact_params(contact))
         result = self.cursor.fetchone()
         if not result:
             raise RuntimeError(f"Failed to insert/update user: {contact.email}")
         return result["email"]
 
     def add_resume_path(self, path: str, user: str) -> int:
-        # Ensure the user row exists before inserting the resume (FK safety net)
-        self.cursor.execute(
-            """
-            INSERT INTO users (name, email, phone, country_code, linkedin, github, location)
-            VALUES (%(email)s, %(email)s, '0000000000', '+1', '', '', '')
-            ON CONFLICT (email) DO NOTHING
-            """,
-            {"email": user},
-        )
+        self.resume_data_changed = True
+        # Ensure the user row exists (FK safety net) and allocate the resume id
+        # in one statement; the FK is checked once the whole statement is done
         sql = """
+            WITH placeholder_user AS (
+                INSERT INTO users (name, email, phone, country_code, linkedin, github, location)
+                VALUES (%(user_email)s, %(user_email)s, '0000000000', '+1', '', '', '')
+                ON CONFLICT (email) DO NOTHING
+            )
             INSERT INTO resumes (id, user_email, path)
             VALUES (DEFAULT, %(user_email)s, %(path)s)
             RETURNING id
@@ -228,6 +655,7 @@ class AutoApply:
                                    linkedin: str, github: str,
                                    password_hash: str) -> str:
         """Upsert user and set password hash. Returns email."""
+        self.resume_data_changed = True
         self.cursor.execute(
             """
             INSERT INTO users (name, email, phone, country_code, linkedin, github, location, password_hash)
@@ -263,131 +691,28 @@ class AutoApply:
         return self.cursor.fetchone()
 
     def get_resume_path(self, resume_id: int) -> str:
-        sql = """
-            SELECT path
-            FROM resumes
-            WHERE id=%(resume_id)s
-        """
-
-        self.cursor.execute(sql, {"resume_id": resume_id})
-
-        result = self.cursor.fetchone()
+        result = self.get_resume_record(resume_id)
         if not result:
             raise RuntimeError(f"No data found for {resume_id}")
 
         return result["path"]
 
     def insert_resume(self, resume: Resume, path: Optional[str] = None) -> int:
-        # First, ensure the user exists in the users table
-        self.upsert_user(resume.contact)
-
-        # Convert Pydantic models to dicts for JSONB columns
-        # Use mode='json' to properly serialize dates and other non-JSON types
-        job_exp_dicts = [
-            exp.model_dump(mode="json") if hasattr(exp, "model_dump") else exp
-            for exp in resume.job_exp
-        ]
-        education_dicts = [
-            edu.model_dump(mode="json") if hasattr(edu, "model_dump") else edu
-            for edu in resume.education
-        ]
-        skills_data = [
-            skill.model_dump(mode="json") if hasattr(skill, "model_dump") else skill
-            for skill in resume.skills
-        ]
-        cert_dicts = [
-            cert.model_dump(mode="json") if hasattr(cert, "model_dump") else cert
-            for cert in resume.certifications
-        ]
-        projects_dicts = [
-            proj.model_dump(mode="json") if hasattr(proj, "model_dump") else proj
-            for proj in resume.projects
-        ]
-        achievements_dicts = [
-            ach.model_dump(mode="json") if hasattr(ach, "model_dump") else ach
-            for ach in resume.achievements
-        ]
-
-        self.cursor.execute(
-            """
-            INSERT INTO resumes (id, user_email, path, summary, job_experience, education, skills, certifications, projects, achievements)
-            VALUES (DEFAULT, %(user_email)s, %(path)s, %(summary)s, %(job_experience)s, %(education)s, %(skills)s, %(certifications)s, %(projects)s, %(achievements)s)
-            RETURNING id
-            """,
-            {
-                "user_email": resume.contact.email,
-                "path": path,
-                "summary": resume.summary,
-                "job_experience": Json(job_exp_dicts),
-                "education": Json(education_dicts),
-                "skills": Json(skills_data),
-                "certifications": Json(cert_dicts),
-                "projects": Json(projects_dicts),
-                "achievements": Json(achievements_dicts),
-            },
-        )
+        """Insert a parsed resume and upsert its owner, in one statement."""
+        self.resume_data_changed = True
+        self.cursor.execute(_INSERT_RESUME_SQL, _resume_params(resume, path))
         result = self.cursor.fetchone()
         if not result:
             raise RuntimeError("Errored creating resume")
         return result["id"]
 
     def upsert_resume(self, resume: Resume, path: Optional[str] = None) -> int:
-        """Update existing resume by path with parsed data, or insert if not exists."""
-        # First, ensure the user exists in the users table
-        self.upsert_user(resume.contact)
-
-        # Convert Pydantic models to dicts for JSONB columns
-        job_exp_dicts = [
-            exp.model_dump(mode="json") if hasattr(exp, "model_dump") else exp
-            for exp in resume.job_exp
-        ]
-        education_dicts = [
-            edu.model_dump(mode="json") if hasattr(edu, "model_dump") else edu
-            for edu in resume.education
-        ]
-        skills_data = [
-            skill.model_dump(mode="json") if hasattr(skill, "model_dump") else skill
-            for skill in resume.skills
-        ]
-        cert_dicts = [
-            cert.model_dump(mode="json") if hasattr(cert, "model_dump") else cert
-            for cert in resume.certifications
-        ]
-        projects_dicts = [
-            proj.model_dump(mode="json") if hasattr(proj, "model_dump") else proj
-            for proj in resume.projects
-        ]
-        achievements_dicts = [
-            ach.model_dump(mode="json") if hasattr(ach, "model_dump") else ach
-            for ach in resume.achievements
-        ]
-
-        self.cursor.execute(
-            """
-            UPDATE resumes
-            SET user_email = %(user_email)s,
-                summary = %(summary)s,
-                job_experience = %(job_experience)s,
-                education = %(education)s,
-                skills = %(skills)s,
-                certifications = %(certifications)s,
-                projects = %(projects)s,
-                achievements = %(achievements)s
-            WHERE path = %(path)s
-            RETURNING id
-            """,
-            {
-                "user_email": resume.contact.email,
-                "path": path,
-                "summary": resume.summary,
-                "job_experience": Json(job_exp_dicts),
-                "education": Json(education_dicts),
-                "skills": Json(skills_data),
-                "certifications": Json(cert_dicts),
-                "projects": Json(projects_dicts),
-                "achievements": Json(achievements_dicts),
-            },
-        )
+        """
+        Update the resume created by add_resume_path with parsed data and
+        upsert its owner, in one statement.
+        """
+        self.resume_data_changed = True
+        self.cursor.execute(_UPDATE_RESUME_SQL, _resume_params(resume, path))
         result = self.cursor.fetchone()
         if not result:
             raise RuntimeError(f"Failed to upsert resume for path: {path}")
@@ -398,46 +723,70 @@ class AutoApply:
         Get contact details for a resume by joining with users table.
         Returns list with one contact dict that can be unpacked into Contact model.
         """
-        sql = """
-            SELECT u.name, u.email, u.phone, u.country_code, u.linkedin, u.github, u.location
-            FROM resumes r
-            JOIN users u ON r.user_email = u.email
-            WHERE r.id = %(resume_id)s
+        result = self.get_resume_record(resume_id)
+        if not result or result["email"] is None:
+            return []
+        return [{field: result[field] for field in _CONTACT_FIELDS}]
+
+    def get_resume_record(self, resume_id: int) -> Optional[dict]:
+        """
+        Get a resume row together with its owner's contact fields and
+        application data (user_data row as a dict, or None).
+        Backs the per-section getters below, so assembling a resume costs one
+        query (and none while it is cached) instead of one per section.
+        Returns dict or None if the resume does not exist.
         """
+        return self._cached("resume", resume_id, self._load_resume_record)
 
-        self.cursor.execute(sql, {"resume_id": resume_id})
-        return self.cursor.fetchall()
+    def _load_resume_record(self, resume_id: int) -> Optional[dict]:
+        sql = _RESUME_RECORD_SQL + "WHERE r.id = %(resume_id)s"
+
+        self._execute("ap_resume_record", sql, {"resume_id": resume_id})
+        result = self.cursor.fetchone()
+        if not result:
+            return None
+        return _resume_record(result)
+
+    def get_resume_model(self, resume_id: int) -> Resume:
+        """
+        Get a resume as a validated Resume model.
+        The model itself is cached, so repeated reads skip Pydantic validation.
+        Raises RuntimeError if the resume or its summary is missing.
+        """
+        return self._cached("resume_model", resume_id, self._load_resume)
+
+    def _load_resume(self, resume_id: int) -> Resume:
+        contact = self.list_contact(resume_id)
+        if not contact:
+            raise RuntimeError(f"{resume_id} not found in database")
+
+        summary = self.get_summary(resume_id)
+        if not summary:
+            raise RuntimeError("No summary found")
+
+        return Resume(
+            contact=Contact(**contact[0]),
+            summary=summary,
+            job_exp=[JobExperience(**job_exp) for job_exp in self.list_job_exps(resume_id)],
+            skills=[Skills(**skill) for skill in self.list_skills(resume_id)],
+            education=[Education(**edu) for edu in self.list_education(resume_id)],
+            certifications=[
+                Certification(**cert) for cert in self.list_certifications(resume_id)
+            ],
+        )
 
     def list_job_exps(self, resume_id: int) -> list[dict]:
         """
         Get job experience array from resume JSONB column.
         Returns list of job experience dictionaries.
         """
-        sql = """
-            SELECT job_experience FROM resumes
-            WHERE id=%(resume_id)s
-        """
-
-        self.cursor.execute(sql, {"resume_id": resume_id})
-        result = self.cursor.fetchone()
+        result = self.get_resume_record(resume_id)
 
         if not result or not result["job_experience"]:
             return []
 
-        # job_experience is already a Python list/dict (psycopg2 auto-converts JSONB)
+        # End dates were already parsed when the record was loaded
         jobs = result["job_experience"]
-
-        # Handle date parsing if needed (JSONB stores "from_"/"to_" as Python field names)
-        if isinstance(jobs, list):
-            for job in jobs:
-                to_val = job.get("to_") or job.get("to_date")
-                if isinstance(to_val, str) and to_val.lower() not in ["current", "present"]:
-                    try:
-                        parsed_date = datetime.strptime(to_val.strip(), "%Y-%m-%d").date()
-                        job["to_"] = parsed_date
-                    except (ValueError, AttributeError):
-                        pass
-
         return jobs if isinstance(jobs, list) else []
 
     def list_education(self, resume_id: int) -> list[dict]:
@@ -445,13 +794,7 @@ class AutoApply:
         Get education array from resume JSONB column.
         Returns list of education dictionaries.
         """
-        sql = """
-            SELECT education FROM resumes
-            WHERE id=%(resume_id)s
-        """
-
-        self.cursor.execute(sql, {"resume_id": resume_id})
-        result = self.cursor.fetchone()
+        result = self.get_resume_record(resume_id)
 
         if not result or not result["education"]:
             return []
@@ -464,13 +807,7 @@ class AutoApply:
         Get certifications array from resume JSONB column.
         Returns list of certification dictionaries.
         """
-        sql = """
-            SELECT certifications FROM resumes
-            WHERE id=%(resume_id)s
-        """
-
-        self.cursor.execute(sql, {"resume_id": resume_id})
-        result = self.cursor.fetchone()
+        result = self.get_resume_record(resume_id)
 
         if not result or not result["certifications"]:
             return []
@@ -483,13 +820,7 @@ class AutoApply:
         Get skills from resume JSONB column.
         Returns skills object (could be dict or list depending on schema).
         """
-        sql = """
-            SELECT skills FROM resumes
-            WHERE id=%(resume_id)s
-        """
-
-        self.cursor.execute(sql, {"resume_id": resume_id})
-        result = self.cursor.fetchone()
+        result = self.get_resume_record(resume_id)
 
         if not result or not result["skills"]:
             return []
@@ -503,13 +834,7 @@ class AutoApply:
         Get resume summary text.
         Returns summary string or None.
         """
-        sql = """
-            SELECT summary FROM resumes
-            WHERE id=%(resume_id)s
-        """
-
-        self.cursor.execute(sql, {"resume_id": resume_id})
-        result = self.cursor.fetchone()
+        result = self.get_resume_record(resume_id)
 
         return result["summary"] if result else None
 
@@ -518,13 +843,7 @@ class AutoApply:
         Get projects array from resume JSONB column.
         Returns list of project dictionaries.
         """
-        sql = """
-            SELECT projects FROM resumes
-            WHERE id=%(resume_id)s
-        """
-
-        self.cursor.execute(sql, {"resume_id": resume_id})
-        result = self.cursor.fetchone()
+        result = self.get_resume_record(resume_id)
 
         if not result or not result["projects"]:
             return []
@@ -537,13 +856,7 @@ class AutoApply:
         Get achievements array from resume JSONB column.
         Returns list of achievement dictionaries.
         """
-        sql = """
-            SELECT achievements FROM resumes
-            WHERE id=%(resume_id)s
-        """
-
-        self.cursor.execute(sql, {"resume_id": resume_id})
-        result = self.cursor.fetchone()
+        result = self.get_resume_record(resume_id)
 
         if not result or not result["achievements"]:
             return []
@@ -555,7 +868,11 @@ class AutoApply:
         """
         List resumes, optionally filtered by user email.
         Returns list of resume records.
+        Cached like the per-resume lookups; any committed resume write clears it.
         """
+        return self._cached("resumes", user_email or "", self._load_resumes)
+
+    def _load_resumes(self, user_email: str) -> list[dict]:
         if user_email:
             sql = """
                 SELECT id, user_email, path
@@ -571,7 +888,7 @@ class AutoApply:
                 ORDER BY id DESC
             """
             self.cursor.execute(sql)
-        return self.cursor.fetchall()
+        return [dict(row) for row in self.cursor.fetchall()]
 
     def get_jd_resume(self, url: str) -> dict[str]:
         """
@@ -584,7 +901,7 @@ class AutoApply:
             WHERE url=%(url)s
         """
 
-        self.cursor.execute(sql, {"url": url})
+        self._execute("ap_jd_resume", sql, {"url": url})
         result = self.cursor.fetchone()
 
         return result if result else None
@@ -600,7 +917,7 @@ class AutoApply:
             WHERE url=%(url)s
         """
 
-        self.cursor.execute(sql, {"url": url})
+        self._execute("ap_job_resume_path", sql, {"url": url})
         result = self.cursor.fetchone()
 
         return result["resume_path"] if result else None
@@ -619,7 +936,7 @@ class AutoApply:
             """,
             {
                 "url": url,
-                "application_qnas": Json(qnas),
+                "application_qnas": _json(qnas),
             },
         )
         result = self.cursor.fetchone()
@@ -627,6 +944,24 @@ class AutoApply:
             raise RuntimeError(f"Job not found: {url}")
         return result["url"]
 
+    def merge_qnas(self, qnas: dict, url: str) -> Optional[str]:
+        """
+        Add question -> answer pairs to a job's application_qnas, replacing
+        earlier answers to the same questions.
+        Returns the job URL, or None if the job doesn't exist.
+        """
+        self.cursor.execute(
+            """
+                UPDATE jobs
+                SET application_qnas = COALESCE(application_qnas, '{}'::jsonb) || %(qnas)s
+                WHERE url = %(url)s
+                RETURNING url
+            """,
+            {"url": url, "qnas": _json(qnas)},
+        )
+        result = self.cursor.fetchone()
+        return result["url"] if result else None
+
     def has_user_data(self, email: str) -> bool:
         self.cursor.execute(
             "SELECT 1 FROM user_data WHERE email = %(email)s LIMIT 1",
@@ -647,6 +982,7 @@ class AutoApply:
         Insert or update user application data.
         Returns the user's email.
         """
+        self.resume_data_changed = True
         self.cursor.execute(
             """
             INSERT INTO user_data (
@@ -725,30 +1061,30 @@ class AutoApply:
         """
         Get combined candidate data formatted for JobApplicationAgent.
         Returns dict with all candidate information in flat structure.
+        Cached per resume_id when resume_path is not overridden.
 
         Args:
             resume_id: Resume ID to fetch
-            resume_path: Path to resume file. Defaults to 'data/resumes/aws/shashank_reddy.pdf'
+            resume_path: Path to resume file. Defaults to the resume's own path, else _DEFAULT_RESUME_PATH
         """
-        # Get contact info
-        contact_list = self.list_contact(resume_id)
-        if not contact_list:
+        if resume_path is None:
+            return self._cached("candidate", resume_id, self._load_candidate_data)
+        return self._load_candidate_data(resume_id, resume_path)
+
+    def _load_candidate_data(
+        self, resume_id: int, resume_path: Optional[str] = None
+    ) -> dict:
+        # One (cached) record has every section; reading it directly spares the
+        # per-section getters' copies of it
+        resume_result = self.get_resume_record(resume_id)
+        if not resume_result or resume_result["email"] is None:
             raise RuntimeError(f"Resume {resume_id} not found")
 
-        contact = contact_list[0]
-
-        # Get resume path from database or use default
-        sql_resume_path = """
-            SELECT path FROM resumes WHERE id = %(resume_id)s
-        """
-        self.cursor.execute(sql_resume_path, {"resume_id": resume_id})
-        resume_result = self.cursor.fetchone()
+        contact = {field: resume_result[field] for field in _CONTACT_FIELDS}
 
+        # Resume path from the same record, or the default
         if resume_path is None:
-            if resume_result and resume_result.get("path"):
-                resume_path = resume_result["path"]
-            else:
-                resume_path = "data/resumes/aws/shashank_reddy.pdf"
+            resume_path = resume_result["path"] or _DEFAULT_RESUME_PATH
 
         # Parse name into first/last
         full_name = contact.get("name", "")
@@ -776,12 +1112,14 @@ class AutoApply:
         }
 
         # Get resume components for the resume_text field
-        summary = self.get_summary(resume_id)
-        job_exps = self.list_job_exps(resume_id)
-        skills = self.list_skills(resume_id)
-        education = self.list_education(resume_id)
-        projects = self.list_projects(resume_id)
-        achievements = self.list_achievements(resume_id)
+        summary = resume_result["summary"]
+        job_exps = _json_list(resume_result["job_experience"])
+        skills = resume_result["skills"]
+        if not isinstance(skills, (list, dict)):
+            skills = []
+        education = _json_list(resume_result["education"])
+        projects = _json_list(resume_result["projects"])
+        achievements = _json_list(resume_result["achievements"])
 
         # Build resume text for answering questions
         resume_text_parts = []
@@ -831,17 +1169,12 @@ class AutoApply:
         candidate_data["projects"] = projects if projects else []
         candidate_data["achievements"] = achievements if achievements else []
 
-        # Get user application data
-        sql = """
-            SELECT * FROM user_data
-            WHERE email = %(email)s
-        """
-        self.cursor.execute(sql, {"email": contact["email"]})
-        user_data_result = self.cursor.fetchone()
+        # User application data came back with the resume record (all of its
+        # columns are JSON-native, so the jsonb round trip is lossless)
+        user_data = resume_result.get("user_data")
 
         # Merge user_data if exists
-        if user_data_result:
-            user_data = dict(user_data_result)
+        if user_data:
             # Add relevant fields from user_data
             saved_yoe = user_data.get("years_of_experience")
             candidate_data["years_of_experience"] = saved_yoe if saved_yoe else _calc_years_of_experience(job_exps)
@@ -882,26 +1215,15 @@ class AutoApply:
         Returns the conversation ID.
         """
         self.cursor.execute(
-            """
-            INSERT INTO conversations (
-                session_id, user_email, job_url, endpoint, agent_type,
-                messages, usage_metrics, iterations, success, error_message
-            )
-            VALUES (
-                %(session_id)s, %(user_email)s, %(job_url)s, %(endpoint)s,
-                %(agent_type)s, %(messages)s, %(usage_metrics)s,
-                %(iterations)s, %(success)s, %(error_message)s
-            )
-            RETURNING id
-            """,
+            _INSERT_CONVERSATION_SQL,
             {
                 "session_id": session_id,
                 "user_email": user_email,
                 "job_url": job_url,
                 "endpoint": endpoint,
                 "agent_type": agent_type,
-                "messages": Json(messages),
-                "usage_metrics": Json(usage_metrics),
+                "messages": _json(messages),
+                "usage_metrics": _json(usage_metrics),
                 "iterations": iterations,
                 "success": success,
                 "error_message": error_message,
@@ -917,14 +1239,64 @@ class AutoApply:
         Get user email for a given resume ID.
         Returns email string or None.
         """
-        sql = """
-            SELECT user_email FROM resumes
-            WHERE id = %(resume_id)s
-        """
-        self.cursor.execute(sql, {"resume_id": resume_id})
-        result = self.cursor.fetchone()
+        result = self.get_resume_record(resume_id)
         return result["user_email"] if result else None
 
+    def record_apply_result(
+        self,
+        job: Optional[Job],
+        resume_id: int,
+        session_id: str,
+        agent_data: Optional[dict],
+        endpoint: str,
+        agent_type: str,
+        job_url: Optional[str] = None,
+        error_message: Optional[str] = None,
+    ) -> None:
+        """
+        Save everything a tailor/apply run produced for one URL: the job row
+        (if any) and the agent conversation, within the current transaction.
+        Without agent_data a failed, empty conversation is recorded instead.
+        Both statements are sent to the server in one round trip.
+        """
+        statements, params = [], {}
+        if job is not None:
+            statements.append(_UPSERT_JOB_SQL)
+            params.update(_job_params(job, resume_id))
+            job_url = job_url or job.url
+
+        # Served from the resume cache, so usually no query
+        user_email = self.get_user_email_by_resume(resume_id)
+        if user_email:
+            if agent_data is None:
+                agent_data = {
+                    "messages": [],
+                    "usage": {},
+                    "iterations": 0,
+                    "success": False,
+                    "error": error_message,
+                }
+            statements.append(_INSERT_CONVERSATION_SQL)
+            params.update(
+                {
+                    "session_id": session_id,
+                    "user_email": user_email,
+                    "job_url": job_url,
+                    "endpoint": endpoint,
+                    "agent_type": agent_type,
+                    "messages": _json(agent_data["messages"]),
+                    "usage_metrics": _json(agent_data["usage"]),
+                    "iterations": agent_data["iterations"],
+                    "success": agent_data["success"],
+                    "error_message": agent_data["error"],
+                }
+            )
+
+        if statements:
+            # psycopg2 has no pipeline mode, but a multi-statement query is
+            # still a single round trip
+            self.cursor.execute(";\n".join(statements), params)
+
     def create_application_session(
         self,
         session_id: str,
@@ -960,15 +1332,34 @@ class AutoApply:
             raise RuntimeError(f"Failed to create application session: {session_id}")
         return result["session_id"]
 
+    def create_application_sessions(self, sessions: list[dict]) -> None:
+        """
+        Create several queued sessions with one multi-row INSERT.
+
+        Args:
+            sessions: Dicts with session_id, job_url, resume_id, status, screenshot_dir
+        """
+        execute_values(
+            self.cursor,
+            """
+            INSERT INTO job_application_sessions (
+                session_id, job_url, resume_id, status, screenshot_dir
+            )
+            VALUES %s
+            """,
+            sessions,
+            template="(%(session_id)s, %(job_url)s, %(resume_id)s, %(status)s, %(screenshot_dir)s)",
+        )
+
     def list_application_sessions(self, date=None, user_email: Optional[str] = None) -> list[dict]:
         """List application sessions, optionally filtered by UTC date and/or user."""
         conditions = []
         params: dict = {}
         if date:
             from datetime import timedelta
-            conditions.append("s.created_at::date >= %(date)s AND s.created_at::date <= %(date_plus1)s")
+            conditions.append("s.created_at >= %(date)s AND s.created_at < %(date_plus2)s")
             params["date"] = date
-            params["date_plus1"] = date + timedelta(days=1)
+            params["date_plus2"] = date + timedelta(days=2)
         if user_email:
             conditions.append("r.user_email = %(user_email)s")
             params["user_email"] = user_email
@@ -1097,29 +1488,32 @@ class AutoApply:
         """Return only URLs that haven't been successfully tailored before today for this user."""
         if not urls:
             return []
-        self.cursor.execute(
-            """
-            SELECT j.url FROM jobs j
-            JOIN resumes r ON j.resume_id = r.id
-            WHERE j.url = ANY(%s)
-              AND r.user_email = %s
-              AND j.resume_path IS NOT NULL
-              AND j.date_applied::date < CURRENT_DATE
-            """,
-            (urls, user_email),
+        already_done = set(
+            self._fetch_column(
+                """
+                SELECT j.url FROM jobs j
+                JOIN resumes r ON j.resume_id = r.id
+                WHERE j.url = ANY(%s)
+                  AND r.user_email = %s
+                  AND j.resume_path IS NOT NULL
+                  AND j.date_applied::date < CURRENT_DATE
+                """,
+                (urls, user_email),
+            )
         )
-        already_done = {row["url"] for row in self.cursor.fetchall()}
         return [u for u in urls if u not in already_done]
 
     def insert_fetched_urls(self, urls: list[str], user_email: str, resume_id: Optional[int], action: str) -> None:
-        """Bulk-insert URLs into jobs_fetched, ignoring duplicates."""
-        self.cursor.executemany(
+        """Bulk-insert URLs into jobs_fetched as one INSERT, ignoring duplicates."""
+        execute_values(
+            self.cursor,
             """
             INSERT INTO jobs_fetched (url, user_email, resume_id, action)
-            VALUES (%s, %s, %s, %s)
+            VALUES %s
             ON CONFLICT (url, user_email, date_fetched, action) DO NOTHING
             """,
             [(url, user_email, resume_id, action) for url in urls],
+            page_size=500,
         )
 
     def list_fetched_urls(self, date=None, user_email: Optional[str] = None) -> list[dict]:
@@ -1224,25 +1618,63 @@ class AutoApply:
         """
         if not urls:
             return 0
-        self.cursor.executemany(
+        # One statement can't update the same row twice, so drop repeats first
+        values = [(url, search_query) for url in dict.fromkeys(urls)]
+        if len(values) >= DB_COPY_THRESHOLD:
+            return self._copy_discovered_jobs(values)
+        rows = execute_values(
+            self.cursor,
             """
             INSERT INTO discovered_jobs (url, search_query)
-            VALUES (%s, %s)
+            VALUES %s
             ON CONFLICT (url) DO UPDATE SET last_seen_at = CURRENT_TIMESTAMP
+            RETURNING (xmax = 0) AS inserted
             """,
-            [(url, search_query) for url in urls],
+            values,
+            page_size=500,
+            fetch=True,
         )
-        return self.cursor.rowcount
+        return sum(1 for row in rows if row["inserted"])
+
+    def _copy_discovered_jobs(self, values: list[tuple[str, str]]) -> int:
+        """
+        Large-batch path of insert_discovered_jobs: COPY the rows into a
+        staging table, then upsert them with a single INSERT ... SELECT.
+        """
+        self.cursor.execute(
+            """
+            CREATE TEMP TABLE IF NOT EXISTS discovered_jobs_stage
+                (url TEXT, search_query TEXT) ON COMMIT DROP;
+            TRUNCATE discovered_jobs_stage;
+            """
+        )
+        buf = io.StringIO()
+        csv.writer(buf).writerows(values)
+        buf.seek(0)
+        self.cursor.copy_expert(
+            "COPY discovered_jobs_stage (url, search_query) FROM STDIN WITH (FORMAT csv)",
+            buf,
+        )
+        self.cursor.execute(
+            """
+            INSERT INTO discovered_jobs (url, search_query)
+            SELECT url, search_query FROM discovered_jobs_stage
+            ON CONFLICT (url) DO UPDATE SET last_seen_at = CURRENT_TIMESTAMP
+            RETURNING (xmax = 0) AS inserted
+            """
+        )
+        return sum(1 for row in self.cursor.fetchall() if row["inserted"])
 
     def check_urls_exist(self, urls: list[str]) -> set[str]:
         """Return the subset of the given URLs that are already in discovered_jobs."""
         if not urls:
             return set()
-        self.cursor.execute(
-            "SELECT url FROM discovered_jobs WHERE url = ANY(%(urls)s)",
-            {"urls": urls},
+        return set(
+            self._fetch_column(
+                "SELECT url FROM discovered_jobs WHERE url = ANY(%(urls)s)",
+                {"urls": urls},
+            )
         )
-        return {row["url"] for row in self.cursor.fetchall()}
 
     def query_discovered_jobs(
         self,
@@ -1264,8 +1696,7 @@ class AutoApply:
 
         where = ("WHERE " + " AND ".join(conditions)) if conditions else ""
         sql = f"SELECT url FROM discovered_jobs {where} ORDER BY last_seen_at DESC"
-        self.cursor.execute(sql, params)
-        urls = [row["url"] for row in self.cursor.fetchall()]
+        urls = self._fetch_column(sql, params)
 
         # Filter by ATS site domains in Python (simpler than dynamic SQL ANY)
         if ats_sites:
@@ -1299,7 +1730,7 @@ class AutoApply:
                 "session_id": session_id,
                 "event_type": event_type,
                 "content": content,
-                "metadata": Json(metadata) if metadata else None,
+                "metadata": _json(metadata) if metadata else None,
                 "screenshot_path": screenshot_path,
             },
         )
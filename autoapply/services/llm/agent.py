@@ -8,10 +8,38 @@ from pydantic import BaseModel
 
 from autoapply.env import MODEL, OPENROUTER_API_KEY, LLM_BASE_URL
 from autoapply.logging import get_logger
+from autoapply.services.llm.cache import llm_cache
 
 get_logger()
 logger = logging.getLogger(__name__)
 
+# One keep-alive connection pool for every agent, so concurrent and back-to-back
+# LLM calls reuse connections instead of paying a TLS handshake each time.
+_http_client: Optional[httpx.AsyncClient] = None
+_http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _shared_http_client() -> httpx.AsyncClient:
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    # A client is tied to the loop it was opened on (scripts may run several)
+    if _http_client is None or _http_client_loop is not loop:
+        _http_client = httpx.AsyncClient(
+            timeout=120.0,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+        )
+        _http_client_loop = loop
+    return _http_client
+
+
+async def close_http_client():
+    """Close the shared LLM HTTP client. Called during application shutdown."""
+    global _http_client, _http_client_loop
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+        _http_client_loop = None
+
 
 class AgentResult(BaseModel):
     """Result from agent execution"""
@@ -45,6 +73,7 @@ class Agent:
         temperature: float = 0.7,
         max_tokens: Optional[int] = None,
         tool_schemas: Optional[Dict[str, Type[BaseModel]]] = None,
+        cache: bool = False,
     ):
         """
         Initialize agent.
@@ -58,6 +87,8 @@ class Agent:
             temperature: LLM temperature (0-1)
             max_tokens: Maximum tokens to generate
             tool_schemas: Dict mapping tool names to their Pydantic arg models (for validation)
+            cache: Reuse responses for identical requests. Only honoured for
+                agents without tools, whose runs have no side effects.
         """
         self.system_prompt = system_prompt
         self.tools = tools or []
@@ -67,6 +98,7 @@ class Agent:
         self.model = model
         self.temperature = temperature
         self.max_tokens = max_tokens
+        self.cache = cache and not self.tools and llm_cache is not None
 
         self.url = f"{LLM_BASE_URL}/chat/completions"
         self.headers = {"Content-Type": "application/json"}
@@ -98,7 +130,22 @@ class Agent:
 
             system_content += f"\n\nYou must respond with valid JSON matching this exact schema:\n{json.dumps(schema, indent=2)}\n\nReturn only the JSON object, no additional text."
 
-        self.messages = [{"role": "system", "content": system_content}]
+        if self.model.startswith("anthropic/"):
+            # Mark the static prefix (tools + system prompt) as cacheable
+            system_message = {
+                "role": "system",
+                "content": [
+                    {
+                        "type": "text",
+                        "text": system_content,
+                        "cache_control": {"type": "ephemeral"},
+                    }
+                ],
+            }
+        else:
+            system_message = {"role": "system", "content": system_content}
+
+        self.messages = [system_message]
 
     async def _call_llm_with_retry(
         self, payload: dict, max_retries: int = 3
@@ -117,24 +164,23 @@ class Agent:
 
         for attempt in range(max_retries):
             try:
-                async with httpx.AsyncClient(timeout=120.0) as client:
-                    response = await client.post(
-                        self.url, headers=self.headers, json=payload
-                    )
+                response = await _shared_http_client().post(
+                    self.url, headers=self.headers, json=payload
+                )
 
-                    if response.status_code == 200:
-                        return response
-                    elif response.status_code >= 500:
-                        logger.warning(
-                            f"Server error {response.status_code}, "
-                            f"retrying (attempt {attempt + 1}/{max_retries})..."
-                        )
-                    else:
-                        # Client error - don't retry
-                        logger.error(
-                            f"API error {response.status_code}: {response.text}"
-                        )
-                        return None
+                if response.status_code == 200:
+                    return response
+                elif response.status_code >= 500:
+                    logger.warning(
+                        f"Server error {response.status_code}, "
+                        f"retrying (attempt {attempt + 1}/{max_retries})..."
+                    )
+                else:
+                    # Client error - don't retry
+                    logger.error(
+                        f"API error {response.status_code}: {response.text}"
+                    )
+                    return None
 
             except (httpx.ReadError, httpx.ConnectError, httpx.ReadTimeout) as e:
                 logger.warning(
@@ -258,13 +304,18 @@ class Agent:
             f"{len(self.messages)} messages kept"
         )
 
-    async def run(self, query: str, max_iterations: int = 50) -> AgentResult:
+    async def run(
+        self, query: str, max_iterations: int = 50, cacheable_prefix: str = ""
+    ) -> AgentResult:
         """
         Main agent execution loop.
 
         Args:
             query: User query/task
             max_iterations: Maximum number of LLM calls
+            cacheable_prefix: Part of the query that repeats byte-for-byte across
+                runs (e.g. the resume). Sent ahead of query and, for Anthropic
+                models, marked as a prompt-cache breakpoint.
 
         Returns:
             AgentResult with output and metadata
@@ -272,14 +323,39 @@ class Agent:
         self.stop_requested = False
         self.running = True
         self.result = AgentResult()
-        self._initial_query = query
+        self._initial_query = cacheable_prefix + query
 
         # Initialize messages if needed
         if not self.messages:
             self.init_messages()
 
         # Add user query
-        self.messages.append({"role": "user", "content": query})
+        if cacheable_prefix and self.model.startswith("anthropic/"):
+            content = [
+                {
+                    "type": "text",
+                    "text": cacheable_prefix,
+                    "cache_control": {"type": "ephemeral"},
+                },
+                {"type": "text", "text": query},
+            ]
+        else:
+            content = cacheable_prefix + query
+        self.messages.append({"role": "user", "content": content})
+
+        cache_key = None
+        if self.cache:
+            cache_key = llm_cache.make_key(self.model, self.temperature, self.messages)
+            cached = await llm_cache.get_async(cache_key)
+            if cached is not None:
+                logger.info("LLM cache hit, skipping API call")
+                self.result.output = (
+                    self.response_format.model_validate_json(cached)
+                    if self.response_format
+                    else cached
+                )
+                self.running = False
+                return self.result
 
         for iteration in range(max_iterations):
             if self.stop_requested:
@@ -424,6 +500,14 @@ class Agent:
                     logger.debug("No response_format specified, returning raw output")
                     self.result.output = output
 
+                if cache_key:
+                    await llm_cache.set_async(
+                        cache_key,
+                        self.result.output.model_dump_json()
+                        if self.response_format
+                        else self.result.output,
+                    )
+
                 self.running = False
                 return self.result
 
@@ -1,7 +1,12 @@
+import asyncio
+import json
 import logging
+import re
 
 from autoapply.env import MODEL, APPLY_MODEL
-from autoapply.services.llm.agent import Agent
+from autoapply.services.llm.agent import Agent, AgentResult
+from autoapply.services.llm.cache import llm_cache
+from autoapply.services.llm.semantic_cache import semantic_cache
 from autoapply.services.llm.models import get_tool_schema
 
 # Import all browser tool argument models
@@ -49,6 +54,29 @@ from autoapply.services.llm.prompts import (
 
 logger = logging.getLogger(__name__)
 
+# Bump when the cached tailoring payload (output + replayed edits) changes shape
+TAILOR_CACHE_VERSION = "v1"
+
+_NON_WORD_RE = re.compile(r"\W+")
+
+
+def _normalize(text: str) -> str:
+    return " ".join(_NON_WORD_RE.split(text.lower())).strip()
+
+
+def _same_posting(output: dict, job_description: str) -> bool:
+    """
+    Whether a cached tailoring result's role and company both appear in this JD.
+
+    The similarity vectors barely weigh the title line, so two companies'
+    postings with the same body can score as near-duplicates; the cached
+    role/company (and the directory they name) must belong to this job too.
+    """
+    jd = f" {_normalize(job_description)} "
+    role = _normalize(output.get("role") or "")
+    company = _normalize(output.get("company_name") or "")
+    return bool(role and company) and f" {role} " in jd and f" {company} " in jd
+
 
 class JobApplicationAgent(Agent):
     """
@@ -260,10 +288,10 @@ class JobApplicationAgent(Agent):
         Returns:
             AssistedJobApplication with role, company, success status and details
         """
-        # Build the query with candidate data
+        # Candidate data and steps are identical for every job a resume is
+        # applied to; keep them ahead of the URL so the prompt prefix is stable
+        # and provider-side prompt caching can reuse it.
         query = f"""
-Apply to the job at: {job_url}
-
 Use this candidate data to fill the application:
 {candidate_data}
 
@@ -274,6 +302,8 @@ Steps:
 4. Answer any questions based on the candidate's resume
 5. Submit the application
 6. Verify success (look for confirmation message)
+
+Apply to the job at: {job_url}
 """
 
         result = await self.run(query, max_iterations=max_iterations)
@@ -302,11 +332,15 @@ class ResumeTailorAgent(Agent):
         tool_schemas = {"replace": ReplaceArgs}
 
         self._replace_count = 0
+        self._replacements: list[dict] = []  # successful edits, replayed on a cache hit
+        self.document_tools = document_tools
         original_replace = document_tools.replace
 
         async def tracked_replace(args):
             result = await original_replace(args)
             self._replace_count += 1
+            if result == "Successfully replaced":
+                self._replacements.append(args.model_dump())
             return result
 
         tool_functions = {"replace": tracked_replace}
@@ -336,25 +370,85 @@ class ResumeTailorAgent(Agent):
         Returns:
             TailoredResume with optimized content
         """
-        query = f"""
+        resume_text = "\n".join([paragraph.text for paragraph in self.document.paragraphs])
+        # Resume + instructions first, identical for every job, so the provider
+        # can serve that prefix from its prompt cache; only the JD varies.
+        resume_block = f"""
 Resume starts here
 ---
-{"\n".join([paragraph.text for paragraph in self.document.paragraphs])}
+{resume_text}
 ---
 Resume ends here
 
-Job description starts here
+Analyze the resume against the job description below and create a tailored version using the tools you have available.
+
+"""
+        query = f"""Job description starts here
 ---
 {job_description}
 ---
 Job description ends here
-
-Analyze the resume against the job description and create a tailored version using the tools you have available.
 """
 
-        result = await self.run(query, max_iterations=10)
+        # Same resume text + JD + prompt/model -> reuse the earlier result and
+        # replay its document edits instead of paying for another agent run.
+        cache_key = None
+        if llm_cache is not None:
+            cache_key = llm_cache.make_key(
+                "tailor",
+                TAILOR_CACHE_VERSION,
+                self.model,
+                self.system_prompt,
+                resume_block,
+                query,
+            )
+            cached = await llm_cache.get_async(cache_key)
+            if cached is not None:
+                logger.info("Tailor cache hit, replaying stored edits")
+                return await self._replay(json.loads(cached))
+
+        # Near-duplicate JD (same posting from another board) for the same
+        # resume/prompt/model: reuse that result and backfill the exact key.
+        scope = None
+        if cache_key and semantic_cache is not None:
+            scope = llm_cache.make_key(
+                "tailor", TAILOR_CACHE_VERSION, self.model, self.system_prompt, resume_text
+            )
+            similar_key = await asyncio.to_thread(
+                semantic_cache.lookup, scope, job_description
+            )
+            cached = await llm_cache.get_async(similar_key) if similar_key else None
+            payload = json.loads(cached) if cached is not None else None
+            if payload is not None and _same_posting(payload["output"], job_description):
+                logger.info("Tailor cache hit on a near-duplicate JD, replaying stored edits")
+                await llm_cache.set_async(cache_key, cached)
+                return await self._replay(payload)
+
+        result = await self.run(query, max_iterations=10, cacheable_prefix=resume_block)
+
+        if cache_key and result.success and isinstance(result.output, TailoredResume):
+            await llm_cache.set_async(
+                cache_key,
+                json.dumps(
+                    {
+                        "output": result.output.model_dump(mode="json"),
+                        "replacements": self._replacements,
+                    }
+                ),
+            )
+            if scope:
+                await asyncio.to_thread(
+                    semantic_cache.add, scope, job_description, cache_key
+                )
         return result.output
 
+    async def _replay(self, cached: dict) -> TailoredResume:
+        for args in cached["replacements"]:
+            await self.document_tools.replace(ReplaceArgs(**args))
+        self._replacements = cached["replacements"]
+        self.result = AgentResult(output=TailoredResume.model_validate(cached["output"]))
+        return self.result.output
+
 
 class ResumeParserAgent(Agent):
     """
@@ -371,6 +465,7 @@ class ResumeParserAgent(Agent):
             model=model,
             temperature=0.1,  # Very low temperature for accurate parsing
             max_tokens=4000,
+            cache=True,
         )
 
     async def parse_resume(self, resume_text: str) -> Resume:
@@ -411,6 +506,8 @@ class ApplicationQuestionAgent(Agent):
             response_format=ApplicationAnswers,
             model=model,
             temperature=0.7,
+            # Sampled answers: asking again should be able to give a new one
+            cache=False,
         )
 
     async def answer_questions(
@@ -0,0 +1,171 @@
+"""
+Near-duplicate lookup in front of the exact-match LLM cache.
+
+The same posting is often re-crawled from another board with different
+headers, tracking text or whitespace, which misses the exact-hash cache.
+Texts are embedded as L2-normalised hashed word uni/bigram vectors (no model
+download, stable across processes) and compared by cosine similarity; a hit
+returns the exact-cache key of the earlier, near-identical request.
+"""
+
+import atexit
+import logging
+import os
+import re
+import threading
+import time
+import zlib
+from typing import Optional
+
+import numpy as np
+
+from autoapply.env import (
+    LLM_CACHE_ENABLED,
+    SEMANTIC_CACHE_MAX_ENTRIES,
+    SEMANTIC_CACHE_PATH,
+    SEMANTIC_CACHE_THRESHOLD,
+)
+
+logger = logging.getLogger(__name__)
+
+_WORD_RE = re.compile(r"\w+")
+_DIM = 4096
+# The index is rewritten at most this often (and once more at exit), not per add
+_SAVE_INTERVAL_SECONDS = 60
+
+
+def embed(text: str) -> np.ndarray:
+    """
+    Hash word unigrams and bigrams into a fixed-size, L2-normalised vector.
+
+    Args:
+        text: Text to embed
+
+    Returns:
+        float32 vector of length 4096 (all zeros for empty text)
+    """
+    words = _WORD_RE.findall(text.lower())
+    features = words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+    vec = np.zeros(_DIM, dtype=np.float32)
+    if not features:
+        return vec
+    buckets = np.fromiter(
+        (zlib.crc32(f.encode()) % _DIM for f in features),
+        dtype=np.int64,
+        count=len(features),
+    )
+    # Sublinear term frequency so boilerplate repeated many times doesn't dominate
+    vec += np.log1p(np.bincount(buckets, minlength=_DIM)).astype(np.float32)
+    return vec / np.linalg.norm(vec)
+
+
+class SemanticCache:
+    """Cosine-similarity index from request texts to exact-cache keys."""
+
+    def __init__(
+        self,
+        path: str = SEMANTIC_CACHE_PATH,
+        threshold: float = SEMANTIC_CACHE_THRESHOLD,
+        max_entries: int = SEMANTIC_CACHE_MAX_ENTRIES,
+    ):
+        self.path = path
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.vectors: Optional[np.ndarray] = None
+        self.keys: list[str] = []
+        self.scopes: list[str] = []
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._last_save = time.monotonic()
+
+    def _load(self):
+        if self.vectors is not None:
+            return
+        self.vectors = np.zeros((0, _DIM), dtype=np.float32)
+        if not os.path.exists(self.path):
+            return
+        try:
+            with np.load(self.path) as data:
+                self.vectors = data["vectors"].astype(np.float32)
+                self.keys = data["keys"].tolist()
+                self.scopes = data["scopes"].tolist()
+        except (OSError, KeyError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable semantic cache {self.path}: {e}")
+
+    def _save(self):
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.tmp.npz"
+        np.savez(
+            tmp_path,
+            vectors=self.vectors,
+            keys=np.array(self.keys),
+            scopes=np.array(self.scopes),
+        )
+        os.replace(tmp_path, self.path)
+
+    def lookup(self, scope: str, text: str) -> Optional[str]:
+        """
+        Find the exact-cache key of a near-identical earlier request.
+
+        Args:
+            scope: Everything besides text that must match exactly
+                (model, prompt, resume...), as a key string
+            text: The variable part of the request (e.g. the job description)
+
+        Returns:
+            Exact-cache key, or None if nothing in scope is similar enough
+        """
+        query = embed(text)
+        with self._lock:
+            self._load()
+            in_scope = [i for i, s in enumerate(self.scopes) if s == scope]
+            if not in_scope:
+                return None
+            sims = self.vectors[in_scope] @ query
+            best = int(np.argmax(sims))
+            if sims[best] < self.threshold:
+                return None
+            logger.debug(f"Semantic cache hit (similarity {sims[best]:.3f})")
+            return self.keys[in_scope[best]]
+
+    def add(self, scope: str, text: str, key: str):
+        """
+        Index a request text under its exact-cache key, dropping the oldest
+        entries past max_entries.
+
+        Args:
+            scope: Same scope string later passed to lookup()
+            text: The variable part of the request
+            key: Exact-cache key the response was stored under
+        """
+        vec = embed(text)
+        with self._lock:
+            self._load()
+            self.vectors = np.vstack([self.vectors, vec])[-self.max_entries :]
+            self.keys = (self.keys + [key])[-self.max_entries :]
+            self.scopes = (self.scopes + [scope])[-self.max_entries :]
+            self._dirty = True
+            if time.monotonic() - self._last_save >= _SAVE_INTERVAL_SECONDS:
+                self._flush()
+
+    def flush(self):
+        """Write pending entries to disk. Called at exit."""
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        if not self._dirty:
+            return
+        try:
+            self._save()
+        except OSError as e:
+            logger.warning(f"Semantic cache write failed: {e}")
+            return
+        self._dirty = False
+        self._last_save = time.monotonic()
+
+
+semantic_cache = SemanticCache() if LLM_CACHE_ENABLED else None
+if semantic_cache is not None:
+    atexit.register(semantic_cache.flush)
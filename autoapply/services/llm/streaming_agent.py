@@ -22,6 +22,8 @@ from autoapply.services.db import Txc
 
 logger = logging.getLogger(__name__)
 
+SCREENSHOT_JPEG_QUALITY = 60
+
 
 class StreamingJobApplicationAgent(JobApplicationAgent):
     """
@@ -148,22 +150,19 @@ class StreamingJobApplicationAgent(JobApplicationAgent):
             URL path to access the screenshot
         """
         self.screenshot_counter += 1
-        filename = f"step_{self.screenshot_counter:03d}_{tool_name}.png"
+        filename = f"step_{self.screenshot_counter:03d}_{tool_name}.jpg"
         filepath = os.path.join(self.screenshot_dir, filename)
 
         try:
-            # Capture screenshot from Playwright page
-            screenshot_bytes = await self.page.screenshot(type="png", full_page=False)
-
-            # Save to file
-            with open(filepath, "wb") as f:
-                f.write(screenshot_bytes)
+            # Viewport JPEG: much cheaper to encode and serve than PNG
+            screenshot_bytes = await self.page.screenshot(
+                type="jpeg", quality=SCREENSHOT_JPEG_QUALITY, full_page=False
+            )
 
-            # Update latest.png symlink for quick card display
-            latest_path = os.path.join(self.screenshot_dir, "latest.png")
-            if os.path.exists(latest_path) or os.path.islink(latest_path):
-                os.remove(latest_path)
-            os.symlink(filename, latest_path)
+            # Save and repoint latest.jpg off the event loop
+            await asyncio.to_thread(
+                self._write_screenshot, filename, filepath, screenshot_bytes
+            )
 
             # Insert timeline event in database
             try:
@@ -186,6 +185,17 @@ class StreamingJobApplicationAgent(JobApplicationAgent):
             logger.error(f"Failed to capture screenshot: {e}")
             return ""
 
+    def _write_screenshot(self, filename: str, filepath: str, screenshot_bytes: bytes):
+        """Write a screenshot and point the latest.jpg symlink at it."""
+        with open(filepath, "wb") as f:
+            f.write(screenshot_bytes)
+
+        # Update latest.jpg symlink for quick card display
+        latest_path = os.path.join(self.screenshot_dir, "latest.jpg")
+        if os.path.exists(latest_path) or os.path.islink(latest_path):
+            os.remove(latest_path)
+        os.symlink(filename, latest_path)
+
     async def _check_manual_pause(self):
         """Check if user manually requested a pause via the API."""
         try:
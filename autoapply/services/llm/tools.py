@@ -1,5 +1,6 @@
 import asyncio
 import base64
+import json
 import uuid
 import os
 import subprocess
@@ -78,8 +79,9 @@ class BrowserTools:
     async def _take_screenshot_base64(self) -> str:
         """Helper to take a screenshot and return base64 string."""
         try:
-            screenshot_bytes = await self.page.screenshot(type="png")
-            return base64.b64encode(screenshot_bytes).decode("utf-8")
+            screenshot_bytes = await self.page.screenshot(type="jpeg", quality=60)
+            encoded = await asyncio.to_thread(base64.b64encode, screenshot_bytes)
+            return encoded.decode("utf-8")
         except Exception:
             return ""
 
@@ -361,10 +363,10 @@ class BrowserTools:
         if args.filename:
             path = os.path.join("logs", args.filename)
             os.makedirs("logs", exist_ok=True)
+            # json.dump streams many small writes; serialize first, write once
+            payload = json.dumps(filtered)
             with open(path, "w") as f:
-                import json
-
-                json.dump(filtered, f)
+                f.write(payload)
             return {"message": f"Logs saved to {path}"}
 
         return {"messages": filtered}
@@ -591,7 +593,9 @@ test('validation run', async ({{ page }}) => {{
             try:
                 # Use a combination of load states for maximum stability
                 await self.page.wait_for_load_state("domcontentloaded", timeout=2000)
-                await asyncio.sleep(0.5)  # Mandatory settle time
+                # Settle time: returns at once on a page that is already quiet,
+                # gives up after 500ms on one that keeps polling
+                await self.page.wait_for_load_state("networkidle", timeout=500)
             except Exception:
                 pass
 
@@ -767,19 +771,32 @@ test('validation run', async ({{ page }}) => {{
 
 
 class DocumentTools:
-    def __init__(self, file: str):
+    def __init__(self, file: str, autosave: bool = True):
+        """
+        Args:
+            file: DOCX file to edit
+            autosave: Write the file back after every successful replace. When
+                False, edits stay in memory until save() is called.
+        """
         self.file = file
+        self.autosave = autosave
         self.document = Document(file)
 
+    def save(self, path: str):
+        """Write the (edited) document to path."""
+        self.document.save(path)
+        logger.debug(f"Saved as {path}")
+
     async def replace(self, args: ReplaceArgs) -> str:
         count = 0
 
         def _replace_in_paragraph(paragraph):
             """Replace text while preserving run formatting"""
-            if args.search_text not in paragraph.text:
+            # paragraph.text re-joins every run from the XML, so read it once
+            full_text = paragraph.text
+            if args.search_text not in full_text:
                 return False
 
-            full_text = paragraph.text
             new_text = full_text.replace(args.search_text, args.replace_text)
 
             # Preserve formatting by keeping first run's style
@@ -790,9 +807,7 @@ class DocumentTools:
                 font_size = first_run.font.size
                 font_bold = first_run.font.bold
                 font_italic = first_run.font.italic
-                font_color = (
-                    first_run.font.color.rgb if first_run.font.color.rgb else None
-                )
+                font_color = first_run.font.color.rgb or None
 
                 # Clear runs
                 for run in paragraph.runs:
@@ -827,8 +842,8 @@ class DocumentTools:
                             logger.debug("search_text found!")
 
         if count == 1:
-            self.document.save(self.file)
-            logger.debug(f"Saved as {self.file}")
+            if self.autosave:
+                self.save(self.file)
             return "Successfully replaced"
         elif count == 0:
             return "ERROR: search_text not found in document. Make sure to include exact text from the resume including newlines and spacing. Consider copying-pasting directly from the resume."
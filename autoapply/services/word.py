@@ -10,6 +10,14 @@ from autoapply.logging import get_logger
 get_logger()
 logger = logging.getLogger(__name__)
 
+# LibreOffice allows one running instance per user profile; a second
+# conversion against the same profile fails or queues behind the first.
+# Give each concurrent conversion its own profile so they run in parallel.
+PDF_WORKERS = min(4, os.cpu_count() or 1)
+_profile_slots: asyncio.Queue[int] = asyncio.Queue()
+for _slot in range(PDF_WORKERS):
+    _profile_slots.put_nowait(_slot)
+
 
 async def convert_docx_to_pdf(resume_docx: str) -> Optional[str]:
     """Convert DOCX to PDF using LibreOffice"""
@@ -30,10 +38,12 @@ async def convert_docx_to_pdf(resume_docx: str) -> Optional[str]:
     logger.debug(f"Output dir: {output_dir}")
     logger.debug(f"Expected PDF: {expected_pdf}")
 
+    slot = await _profile_slots.get()
     try:
         # Create the subprocess to convert DOCX to PDF
         process = await asyncio.create_subprocess_exec(
             "libreoffice",
+            f"-env:UserInstallation=file:///tmp/autoapply-lo-profile-{slot}",
             "--headless",
             "--convert-to",
             "pdf",
@@ -70,3 +80,5 @@ async def convert_docx_to_pdf(resume_docx: str) -> Optional[str]:
     except Exception as e:
         logger.error(f"Exception during PDF conversion: {e}", exc_info=True)
         return None
+    finally:
+        _profile_slots.put_nowait(slot)
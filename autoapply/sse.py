@@ -8,12 +8,19 @@ from typing import Dict
 
 logger = logging.getLogger(__name__)
 
+# Status updates a client can skip if a newer one arrives before it reads them;
+# final states are always delivered in order.
+_FINAL_STATUSES = {"completed", "failed"}
+
 
 class SSEManager:
     """Manages Server-Sent Event streams for real-time job application monitoring."""
 
     def __init__(self):
         self.active_streams: Dict[str, asyncio.Queue] = {}
+        self.close_requests: Dict[str, asyncio.Event] = {}
+        # session_id -> queued status_update not yet read by the client
+        self.pending_status: Dict[str, dict] = {}
 
     async def add_stream(self, session_id: str) -> asyncio.Queue:
         """
@@ -41,8 +48,42 @@ class SSEManager:
             # Send end signal (None) to close the stream gracefully
             await self.active_streams[session_id].put(None)
             del self.active_streams[session_id]
+            self.pending_status.pop(session_id, None)
             logger.info(f"SSE stream removed for session {session_id}")
 
+        # Viewer went away: release anyone waiting on it
+        close_event = self.close_requests.pop(session_id, None)
+        if close_event:
+            close_event.set()
+
+    def request_close(self, session_id: str):
+        """
+        Mark a session as no longer being watched. Ignored unless the session
+        is being streamed or waited on, so unknown ids leave nothing behind.
+
+        Args:
+            session_id: Session the client is done with
+        """
+        if session_id not in self.active_streams and session_id not in self.close_requests:
+            return
+        self.close_requests.setdefault(session_id, asyncio.Event()).set()
+
+    async def wait_for_close(self, session_id: str):
+        """
+        Wait until the client acknowledges a finished session or disconnects.
+        Returns immediately if nobody is streaming the session.
+
+        Args:
+            session_id: Session identifier to wait on
+        """
+        if session_id not in self.active_streams:
+            return
+        close_event = self.close_requests.setdefault(session_id, asyncio.Event())
+        try:
+            await close_event.wait()
+        finally:
+            self.close_requests.pop(session_id, None)
+
     async def send_event(self, session_id: str, event: dict):
         """
         Send event to specific session stream.
@@ -52,6 +93,19 @@ class SSEManager:
             event: Event data dict with 'type' and 'data' keys
         """
         if session_id in self.active_streams:
+            if _is_progress_status(event):
+                pending = self.pending_status.get(session_id)
+                if pending is not None:
+                    # The client hasn't read the previous update yet: replace
+                    # it in place so it only sees the latest state
+                    pending.clear()
+                    pending.update(event)
+                    return
+                event = dict(event)
+                self.pending_status[session_id] = event
+            else:
+                # Later status updates must not jump ahead of this event
+                self.pending_status.pop(session_id, None)
             try:
                 await self.active_streams[session_id].put(event)
                 logger.debug(f"Event sent to session {session_id}: {event.get('type')}")
@@ -60,6 +114,22 @@ class SSEManager:
         else:
             logger.warning(f"No active stream for session {session_id}")
 
+    async def next_event(self, session_id: str, queue: asyncio.Queue):
+        """
+        Wait for the next event of a stream.
+
+        Args:
+            session_id: Session the queue belongs to
+            queue: Queue returned by add_stream()
+
+        Returns:
+            Event dict, or None once the stream is closed
+        """
+        event = await queue.get()
+        if event is not None and self.pending_status.get(session_id) is event:
+            del self.pending_status[session_id]
+        return event
+
     def has_stream(self, session_id: str) -> bool:
         """
         Check if session has an active stream.
@@ -71,3 +141,10 @@ class SSEManager:
             True if stream exists, False otherwise
         """
         return session_id in self.active_streams
+
+
+def _is_progress_status(event: dict) -> bool:
+    return (
+        event.get("type") == "status_update"
+        and event.get("data", {}).get("status") not in _FINAL_STATUSES
+    )
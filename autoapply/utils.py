@@ -1,11 +1,14 @@
+import asyncio
 import json
 import logging
 import re
 import os
+import time
 import yaml
 
 
 from autoapply.logging import get_logger
+from datetime import date, datetime, timedelta
 from docx import Document
 from pypdf import PdfReader
 from typing import Literal, Union
@@ -14,36 +17,76 @@ from typing import Literal, Union
 get_logger()
 logger = logging.getLogger(__name__)
 
+# (YYYY-MM-DD, timestamp of the next local midnight)
+_today: tuple[str, float] = ("", 0.0)
+
+
+def today_str() -> str:
+    """Today's local date as YYYY-MM-DD, recomputed only once per day."""
+    global _today
+    now = time.time()
+    if now >= _today[1]:
+        day = date.today()
+        next_midnight = datetime.combine(day + timedelta(days=1), datetime.min.time())
+        _today = (day.isoformat(), next_midnight.timestamp())
+    return _today[0]
+
+
+# (path, mtime_ns, size) -> text of a resume/JD file (PDF/DOCX text extracted)
+_file_text_cache: dict[tuple[str, int, int], str] = {}
+_FILE_TEXT_CACHE_SIZE = 64
+
 
 async def read(file: str) -> Union[str, dict]:
-    with open(file, "r") as f:
-        if file.endswith(".json"):
-            return json.load(f)
-        elif file.endswith(".yaml"):
+    if file.endswith((".json", ".yaml")):
+        with open(file, "r") as f:
+            if file.endswith(".json"):
+                return json.load(f)
             return yaml.safe_load(f)
-        elif file.endswith(".pdf"):
-            page = PdfReader(file).pages[0]
-            return page.extract_text()
-        elif file.endswith(".docx"):
-            from docx.oxml.ns import qn
-            doc = Document(file)
-            parts = []
-            # Iterate body children in document order (paragraphs and tables interleaved)
-            for child in doc.element.body:
-                if child.tag == qn('w:p'):
-                    text = child.text_content if hasattr(child, 'text_content') else ''.join(t.text or '' for t in child.iter(qn('w:t')))
-                    if text.strip():
-                        parts.append(text)
-                elif child.tag == qn('w:tbl'):
-                    for row in child.iter(qn('w:tr')):
-                        cells = [''.join(t.text or '' for t in cell.iter(qn('w:t'))) for cell in row.iter(qn('w:tc'))]
-                        line = '\t'.join(c for c in cells if c.strip())
-                        if line.strip():
-                            parts.append(line)
-            return "\n".join(parts)
+
+    # Text is reused until the file changes on disk (JDs and resumes are
+    # read again for every application question)
+    stat = os.stat(file)
+    key = (file, stat.st_mtime_ns, stat.st_size)
+    if key not in _file_text_cache:
+        # PDF/DOCX parsing is CPU-bound; keep it off the event loop
+        text = await asyncio.to_thread(_read_text, file)
+        if len(_file_text_cache) >= _FILE_TEXT_CACHE_SIZE:
+            _file_text_cache.pop(next(iter(_file_text_cache)))
+        _file_text_cache[key] = text
+    return _file_text_cache[key]
+
+
+def _read_text(file: str) -> str:
+    if file.endswith((".pdf", ".docx")):
+        return _extract_document_text(file)
+    with open(file, "r") as f:
         return f.read()
 
 
+def _extract_document_text(file: str) -> str:
+    if file.endswith(".pdf"):
+        page = PdfReader(file).pages[0]
+        return page.extract_text()
+    else:
+        from docx.oxml.ns import qn
+        doc = Document(file)
+        parts = []
+        # Iterate body children in document order (paragraphs and tables interleaved)
+        for child in doc.element.body:
+            if child.tag == qn('w:p'):
+                text = child.text_content if hasattr(child, 'text_content') else ''.join(t.text or '' for t in child.iter(qn('w:t')))
+                if text.strip():
+                    parts.append(text)
+            elif child.tag == qn('w:tbl'):
+                for row in child.iter(qn('w:tr')):
+                    cells = [''.join(t.text or '' for t in cell.iter(qn('w:t'))) for cell in row.iter(qn('w:tc'))]
+                    line = '\t'.join(c for c in cells if c.strip())
+                    if line.strip():
+                        parts.append(line)
+        return "\n".join(parts)
+
+
 async def clean(text: str) -> str:
     text = text.lower()
     return re.sub(r"[^a-zA-Z0-9 \n]", "", text)
@@ -79,17 +122,21 @@ async def get_rough_cloud(content: str) -> Literal["aws", "azu", "gcp"]:
 
 
 async def write(file: str, data: str) -> bool:
+    # Disk I/O runs in a worker thread so concurrent jobs keep running
+    return await asyncio.to_thread(_write_sync, file, data)
+
+
+def _write_sync(file: str, data: str) -> bool:
     # Make sure the directory exists
-    dir = "/".join(file.split("/")[:-1])
-    os.makedirs(dir, exist_ok=True)
+    dir = os.path.dirname(file)
+    if dir:
+        os.makedirs(dir, exist_ok=True)
 
-    # Write to file based on extension
     try:
+        # Serialize first, then write in one call
+        payload = json.dumps(data, indent=4) if file.endswith(".json") else data
         with open(file, "w", encoding="utf-8") as f:
-            if file.endswith(".json"):
-                json.dump(data, f, indent=4)
-                return True
-            f.write(data)
+            f.write(payload)
             return True
     except Exception as e:
         raise ValueError(f"Error occurred while writing {file}: {e}")
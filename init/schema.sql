@@ -269,3 +269,5 @@ CREATE TABLE IF NOT EXISTS discovered_jobs (
     last_seen_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 CREATE INDEX IF NOT EXISTS idx_discovered_jobs_query ON discovered_jobs(search_query);
+-- Newest-first listing (query_discovered_jobs) as an index-only scan
+CREATE INDEX IF NOT EXISTS idx_discovered_jobs_last_seen ON discovered_jobs(last_seen_at DESC) INCLUDE (url, search_query);
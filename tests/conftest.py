@@ -36,7 +36,9 @@ def client():
     with (
         patch("autoapply.api.browser_manager.initialize", new_callable=AsyncMock),
         patch("autoapply.api.browser_manager.shutdown", new_callable=AsyncMock),
+        patch("autoapply.api.browser_pool.prewarm", new_callable=AsyncMock),
         patch("autoapply.api.Txc", mock_Txc),
+        patch("autoapply.api.TxcRO", mock_Txc),
     ):
         from autoapply.api import app
 
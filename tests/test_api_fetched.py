@@ -73,7 +73,7 @@ def test_applytojobs_inserts_with_apply_action(client):
     urls = ["https://job1.com"]
     resume_id = 7
 
-    with patch("asyncio.create_task", side_effect=lambda coro: coro.close()):
+    with patch("autoapply.api._spawn", side_effect=lambda coro: coro.close()):
         response = client.post(
             "/applytojobs", json={"urls": urls, "resume_id": resume_id}
         )
@@ -1,40 +1,48 @@
-"""Unit tests for insert_fetched_urls and list_fetched_urls (mocked cursor, no DB)."""
+"""Unit tests for the fetched/discovered URL queries (mocked cursor, no DB)."""
 
 from datetime import date
-from unittest.mock import call
+from unittest.mock import patch
 
+import pytest
 
-def test_insert_single_url(repo, mock_cursor):
+
+@pytest.fixture
+def execute_values():
+    with patch("autoapply.services.db.execute_values") as mock:
+        yield mock
+
+
+def test_insert_single_url(repo, execute_values):
     repo.insert_fetched_urls(["https://example.com/job1"], "user@example.com", 5, "tailor")
 
-    mock_cursor.executemany.assert_called_once()
-    params = mock_cursor.executemany.call_args.args[1]
+    execute_values.assert_called_once()
+    params = execute_values.call_args.args[2]
     assert params == [("https://example.com/job1", "user@example.com", 5, "tailor")]
 
 
-def test_insert_multiple_urls(repo, mock_cursor):
+def test_insert_multiple_urls(repo, execute_values):
     urls = ["https://job1.com", "https://job2.com", "https://job3.com"]
     repo.insert_fetched_urls(urls, "user@example.com", 10, "apply")
 
-    mock_cursor.executemany.assert_called_once()
-    params = mock_cursor.executemany.call_args.args[1]
+    execute_values.assert_called_once()
+    params = execute_values.call_args.args[2]
     assert len(params) == 3
     assert all(t[1] == "user@example.com" and t[3] == "apply" for t in params)
     assert [t[0] for t in params] == urls
 
 
-def test_insert_empty_list(repo, mock_cursor):
+def test_insert_empty_list(repo, execute_values):
     repo.insert_fetched_urls([], "user@example.com", 1, "tailor")
 
-    mock_cursor.executemany.assert_called_once()
-    params = mock_cursor.executemany.call_args.args[1]
+    execute_values.assert_called_once()
+    params = execute_values.call_args.args[2]
     assert params == []
 
 
-def test_insert_null_resume_id(repo, mock_cursor):
+def test_insert_null_resume_id(repo, execute_values):
     repo.insert_fetched_urls(["https://job.com"], "user@example.com", None, "tailor")
 
-    params = mock_cursor.executemany.call_args.args[1]
+    params = execute_values.call_args.args[2]
     assert params[0][2] is None
 
 
@@ -65,3 +73,35 @@ def test_list_returns_fetchall_result(repo, mock_cursor):
     result = repo.list_fetched_urls(date.today(), user_email="user@example.com")
 
     assert result == expected
+
+
+def test_large_discovered_batch_is_copied(repo, mock_cursor):
+    mock_cursor.fetchall.return_value = [{"inserted": True}, {"inserted": False}]
+    copied = []
+    mock_cursor.copy_expert.side_effect = lambda sql, buf: copied.append(buf.read())
+
+    with patch("autoapply.services.db.DB_COPY_THRESHOLD", 2):
+        inserted = repo.insert_discovered_jobs(
+            ["https://a.com/1", "https://a.com/2", "https://a.com/1"], "data engineer"
+        )
+
+    assert inserted == 1
+    assert copied == ["https://a.com/1,data engineer\r\nhttps://a.com/2,data engineer\r\n"]
+
+
+def test_large_job_batch_is_copied(repo, mock_cursor):
+    from autoapply.application_handlers import placeholder_job
+
+    copied = []
+    mock_cursor.copy_expert.side_effect = lambda sql, buf: copied.append(buf.read())
+
+    with patch("autoapply.services.db.DB_COPY_THRESHOLD", 2):
+        repo.insert_jobs(
+            [placeholder_job("https://a.com/1", ""), placeholder_job("https://a.com/2", "ok")], 7
+        )
+
+    rows = copied[0].splitlines()
+    assert len(rows) == 2
+    assert rows[0].startswith('"https://a.com/1",')
+    assert ',"",' in rows[0]  # empty summary stays an empty string, not NULL
+    assert "INSERT INTO jobs" in mock_cursor.execute.call_args.args[0]
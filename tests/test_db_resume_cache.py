@@ -0,0 +1,186 @@
+"""Unit tests for the cached per-resume record (mocked cursor, no DB)."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from autoapply.services.db import close_pool, invalidate_resume_cache
+
+RECORD = {
+    "id": 7,
+    "user_email": "user@example.com",
+    "path": "data/resumes/user.docx",
+    "summary": "Backend engineer",
+    "job_experience": [{"job_title": "SWE", "company_name": "Acme", "to_": "2024-01-31"}],
+    "education": [],
+    "skills": [{"title": "Languages", "skills": "Python"}],
+    "certifications": [],
+    "projects": [],
+    "achievements": [],
+    "name": "Jane Doe",
+    "email": "user@example.com",
+    "phone": "5550100",
+    "country_code": "+1",
+    "linkedin": "",
+    "github": "",
+    "location": "Remote",
+}
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    invalidate_resume_cache()
+    yield
+    invalidate_resume_cache()
+    close_pool()
+
+
+def test_section_getters_share_one_query(repo, mock_cursor):
+    mock_cursor.fetchone.return_value = dict(RECORD)
+
+    assert repo.get_summary(7) == "Backend engineer"
+    assert repo.list_skills(7) == RECORD["skills"]
+    assert repo.get_resume_path(7) == "data/resumes/user.docx"
+    assert repo.get_user_email_by_resume(7) == "user@example.com"
+    assert repo.list_contact(7)[0]["name"] == "Jane Doe"
+
+    assert mock_cursor.execute.call_count == 1
+
+
+def test_cached_record_is_not_mutated_by_callers(repo, mock_cursor):
+    mock_cursor.fetchone.return_value = dict(RECORD)
+
+    repo.list_job_exps(7)[0]["job_title"] = "changed"
+
+    assert repo.list_job_exps(7)[0]["job_title"] == "SWE"
+
+
+def test_committed_write_invalidates(mock_cursor):
+    from autoapply.services.db import Txc
+
+    conn = MagicMock()
+    conn.__enter__.return_value = conn
+    conn.cursor.return_value.__enter__.return_value = mock_cursor
+    mock_cursor.fetchone.return_value = dict(RECORD)
+
+    with patch("autoapply.services.db.psycopg2.connect", return_value=conn):
+        with Txc() as tx:
+            tx.get_summary(7)
+        with Txc() as tx:
+            tx.resume_data_changed = True  # as set by upsert_resume & co.
+            mock_cursor.fetchone.return_value = dict(RECORD, summary="Updated")
+            assert tx.get_summary(7) == "Backend engineer"  # not committed yet
+        with Txc() as tx:
+            assert tx.get_summary(7) == "Updated"
+
+
+def test_missing_resume(repo, mock_cursor):
+    mock_cursor.fetchone.return_value = None
+
+    assert repo.list_contact(99) == []
+    assert repo.get_user_email_by_resume(99) is None
+    with pytest.raises(RuntimeError):
+        repo.get_resume_path(99)
+
+
+def test_resume_model_is_cached(repo, mock_cursor):
+    job = dict(RECORD["job_experience"][0], location="Remote", experience=["Built things"])
+    mock_cursor.fetchone.return_value = dict(RECORD, job_experience=[job])
+
+    resume = repo.get_resume_model(7)
+    resume.job_exp[0].job_title = "changed"
+
+    again = repo.get_resume_model(7)
+    assert again.contact.name == "Jane Doe"
+    assert again.job_exp[0].job_title == "SWE"
+    assert mock_cursor.execute.call_count == 1
+
+
+def test_load_racing_an_invalidation_is_not_cached(repo, mock_cursor):
+    def stale_read(*args, **kwargs):
+        # A write to this resume commits while the old row is being read
+        invalidate_resume_cache()
+
+    mock_cursor.execute.side_effect = stale_read
+    mock_cursor.fetchone.return_value = dict(RECORD)
+    assert repo.get_summary(7) == "Backend engineer"
+
+    mock_cursor.execute.side_effect = None
+    mock_cursor.fetchone.return_value = dict(RECORD, summary="Updated")
+    assert repo.get_summary(7) == "Updated"
+
+
+def test_record_apply_result_failure_shares_cached_email(repo, mock_cursor):
+    mock_cursor.fetchone.side_effect = [dict(RECORD), {"id": 1}]
+
+    repo.record_apply_result(
+        None, 7, "session", None,
+        endpoint="applytojobs", agent_type="JobApplicationAgent",
+        job_url="https://example.com/job", error_message="boom",
+    )
+
+    assert mock_cursor.execute.call_count == 2  # resume record + conversation
+    params = mock_cursor.execute.call_args.args[1]
+    assert params["user_email"] == "user@example.com"
+    assert params["job_url"] == "https://example.com/job"
+    assert params["success"] is False
+    assert params["error_message"] == "boom"
+
+
+def test_upsert_resume_is_one_statement(repo, mock_cursor):
+    job = dict(RECORD["job_experience"][0], location="Remote", experience=["Built things"])
+    mock_cursor.fetchone.return_value = dict(RECORD, job_experience=[job])
+    resume = repo.get_resume_model(7)
+    mock_cursor.reset_mock()
+    mock_cursor.fetchone.return_value = {"id": 7}
+
+    assert repo.upsert_resume(resume, path=RECORD["path"]) == 7
+
+    mock_cursor.execute.assert_called_once()
+    sql, params = mock_cursor.execute.call_args.args
+    assert "INSERT INTO users" in sql and "UPDATE resumes" in sql
+    assert params["name"] == "Jane Doe"
+    assert params["job_experience"].adapted[0].job_title == "SWE"
+    assert repo.resume_data_changed
+
+
+def test_record_apply_result_sends_job_and_conversation_together(repo, mock_cursor):
+    from autoapply.application_handlers import placeholder_job
+
+    mock_cursor.fetchone.return_value = dict(RECORD)
+    agent_data = {"messages": [], "usage": {}, "iterations": 2, "success": True, "error": None}
+
+    repo.record_apply_result(
+        placeholder_job("https://example.com/job", "ok"), 7, "session", agent_data,
+        endpoint="tailortojobs", agent_type="ResumeTailorAgent",
+    )
+
+    assert mock_cursor.execute.call_count == 2  # resume record + one combined write
+    sql, params = mock_cursor.execute.call_args.args
+    assert "INSERT INTO jobs" in sql and "INSERT INTO conversations" in sql
+    assert params["url"] == params["job_url"] == "https://example.com/job"
+
+
+def test_list_resumes_is_cached_until_invalidated(repo, mock_cursor):
+    mock_cursor.fetchall.return_value = [{"id": 7, "user_email": "user@example.com", "path": "a.docx"}]
+
+    assert repo.list_resumes(user_email="user@example.com")[0]["id"] == 7
+    assert repo.list_resumes(user_email="user@example.com")[0]["id"] == 7
+    assert mock_cursor.execute.call_count == 1
+
+    invalidate_resume_cache()
+    mock_cursor.fetchall.return_value = []
+    assert repo.list_resumes(user_email="user@example.com") == []
+
+
+def test_candidate_data_reads_one_record(repo, mock_cursor):
+    mock_cursor.fetchone.return_value = dict(RECORD, user_data={"years_of_experience": 3})
+
+    data = repo.get_candidate_data(7)
+
+    assert mock_cursor.execute.call_count == 1
+    assert (data["first_name"], data["last_name"]) == ("Jane", "Doe")
+    assert data["resume_path"] == RECORD["path"]
+    assert data["skills"] == ["Python"]
+    assert "- SWE at Acme" in data["resume_text"]
+    assert data["years_of_experience"] == 3
@@ -0,0 +1,50 @@
+"""Unit tests for micro-batched application questions (LLM call mocked)."""
+
+import asyncio
+from unittest.mock import patch
+
+from autoapply.models import ApplicationAnswer, ApplicationAnswers
+
+
+async def _echo_answers(url, questions):
+    await asyncio.sleep(0)
+    return ApplicationAnswers(
+        all_answers=[ApplicationAnswer(questions=q, answer=f"A:{q}") for q in questions]
+    )
+
+
+async def test_cancelled_caller_does_not_break_batch():
+    from autoapply.application_handlers import get_application_answers
+
+    with patch("autoapply.application_handlers._answer_questions", side_effect=_echo_answers):
+        t1 = asyncio.create_task(get_application_answers("https://job", "q1"))
+        await asyncio.sleep(0)
+        t2 = asyncio.create_task(get_application_answers("https://job", "q2"))
+        t3 = asyncio.create_task(get_application_answers("https://job", "q3"))
+        await asyncio.sleep(0)
+        t2.cancel()
+
+        r1, r3 = await asyncio.wait_for(asyncio.gather(t1, t3), timeout=2)
+
+    assert [a.answer for a in r1.all_answers] == ["A:q1"]
+    assert [a.answer for a in r3.all_answers] == ["A:q3"]
+    assert t2.cancelled()
+
+
+async def test_cancelled_first_caller_does_not_cancel_batch():
+    from autoapply.application_handlers import get_application_answers
+
+    with patch(
+        "autoapply.application_handlers._answer_questions", side_effect=_echo_answers
+    ) as answer:
+        t1 = asyncio.create_task(get_application_answers("https://job", "q1"))
+        await asyncio.sleep(0)
+        t2 = asyncio.create_task(get_application_answers("https://job", "q2"))
+        await asyncio.sleep(0)
+        t1.cancel()
+
+        r2 = await asyncio.wait_for(t2, timeout=2)
+
+    assert [a.answer for a in r2.all_answers] == ["A:q2"]
+    assert answer.call_args.args[1] == ["q2"]  # the cancelled caller's question was dropped
+    assert t1.cancelled()
@@ -0,0 +1,25 @@
+"""Unit tests for the near-duplicate tailoring cache (no LLM, temp files)."""
+
+from autoapply.services.llm.agents import _same_posting
+from autoapply.services.llm.semantic_cache import SemanticCache
+
+BODY = "We build data pipelines in Python and Spark on AWS. " * 20
+
+
+def test_near_duplicate_from_another_company_is_rejected():
+    cached = {"role": "Senior Data Engineer", "company_name": "Acme Corp"}
+
+    assert _same_posting(cached, f"Senior Data Engineer at Acme Corp\n{BODY}")
+    assert not _same_posting(cached, f"Staff Data Engineer at Globex Inc\n{BODY}")
+
+
+def test_adds_are_written_on_flush_not_per_add(tmp_path):
+    path = tmp_path / "semantic.npz"
+    cache = SemanticCache(path=str(path), threshold=0.9)
+
+    cache.add("scope", BODY, "key-1")
+    cache.add("scope", BODY + " Remote.", "key-2")
+    assert not path.exists()
+
+    cache.flush()
+    assert SemanticCache(path=str(path)).lookup("scope", BODY) in ("key-1", "key-2")